@@ -2,7 +2,7 @@ import os
 import json
 import time
 import importlib.util
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import requests
 from loguru import logger
 import sys
@@ -13,7 +13,16 @@ import sys
 log_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'log'))
 os.makedirs(log_dir, exist_ok=True)
 log_file_path = os.path.join(log_dir, 'agent.log')
-logger.add(log_file_path, rotation="10 MB", retention="7 days", level="INFO", format="{time} {level} {message}")
+
+# The agent's file sink is enqueued: each record is pickled onto a queue and
+# written by Loguru's worker thread, so step threads never block on file writes
+# or rotation. Only this sink is added here; the stderr sink (handler 0) is left
+# to the entry point, e.g. client.py or the backend
+logger.add(log_file_path, rotation="10 MB", retention="7 days", level="INFO", format="{time} {level} {message}", enqueue=True)
+
+# Step modules loaded so far: step file path -> (mtime_ns, module). Shared by all
+# AgentBase instances so the backend, which creates one per request, benefits too
+_STEP_MODULES: Dict[str, Tuple[int, Any]] = {}
 
 
 class AgentBase:
@@ -303,11 +312,18 @@ class {step_id.title().replace('_', '')}Step(StepBase):
 """
                 f.write(template_content)
         
+        # Reuse the module from an earlier run unless the step file has been edited since
+        mtime_ns = os.stat(step_file).st_mtime_ns
+        cached = _STEP_MODULES.get(step_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
         # Load the module
         spec = importlib.util.spec_from_file_location(f"agent.steps.{step_id}", step_file)
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
         
+        _STEP_MODULES[step_file] = (mtime_ns, module)
         return module
     
     def run_step(self, step_id: str) -> bool:
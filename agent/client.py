@@ -6,9 +6,12 @@ import time
 import argparse
 import importlib
 from typing import Dict, List, Optional, Any, Union
+from loguru import logger
 
-# Add the parent directory to sys.path to resolve imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the parent directory to sys.path to resolve imports, unless it is already there
+_AGENT_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _AGENT_PARENT_DIR not in sys.path:
+    sys.path.insert(0, _AGENT_PARENT_DIR)
 from agent.agent_base import AgentBase
 
 class Agent(AgentBase):
@@ -25,6 +28,11 @@ def main():
     
     args = parser.parse_args()
     
+    # Write console logs through Loguru's worker thread too, like the agent's
+    # file sink, so step threads don't block on a slow terminal
+    logger.remove(0)
+    logger.add(sys.stderr, enqueue=True)
+    
     # Create agent
     agent = Agent(api_url=args.api_url)
     
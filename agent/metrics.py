@@ -0,0 +1,28 @@
+"""Team member performance metrics shared by the steps that analyze and report on them."""
+
+import sys
+from types import MappingProxyType
+
+# The metrics tracked for every team member, in reporting order. Interned
+# explicitly: they are the keys of every strength and improvement lookup
+METRICS = tuple(map(sys.intern, (
+    "code_quality", "productivity", "collaboration",
+    "innovation", "reliability", "customer_focus"
+)))
+
+# Human-readable metric labels, e.g. "code_quality" -> "Code Quality"
+_DISPLAY_METRIC = MappingProxyType({metric: metric.replace("_", " ").title() for metric in METRICS})
+
+
+def display_metric(metric: str) -> str:
+    """
+    Get the human-readable label of a metric.
+    
+    Args:
+        metric: The metric key, e.g. "code_quality".
+        
+    Returns:
+        str: The label, e.g. "Code Quality".
+    """
+    label = _DISPLAY_METRIC.get(metric)
+    return label if label is not None else metric.replace("_", " ").title()
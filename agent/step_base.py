@@ -1,14 +1,172 @@
 import os
-from typing import Optional
+import json
+import mmap
+import shutil
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib json module is used otherwise
+    orjson = None
+
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+
+# Write buffer for streamed outputs; large enough that typical documents go out in one write
+_STREAM_BUFFER_SIZE = 1 << 20
+
+
+# Upper bound on the threads writing a step's output files at once
+_MAX_WRITE_WORKERS = 8
+
+
+def _write_all(fd: int, buffers: List[bytes]) -> None:
+    """
+    Write every buffer to a file descriptor, in order.
+    
+    Uses os.writev so any number of buffers goes out in as few syscalls as
+    possible (one, unless the kernel reports a short write or there are more
+    than IOV_MAX buffers). Falls back to a single joined os.write where writev
+    is unavailable.
+    
+    Args:
+        fd: The file descriptor to write to.
+        buffers: The byte buffers to write.
+    """
+    if not hasattr(os, "writev"):
+        view = memoryview(b"".join(buffers))
+        while view:
+            view = view[os.write(fd, view):]
+        return
+    
+    views = [memoryview(b).cast("B") for b in buffers if len(b)]
+    start = 0
+    while start < len(views):
+        written = os.writev(fd, views[start:start + _IOV_MAX])
+        # Skip fully written buffers and trim a partially written one
+        while written:
+            head = views[start]
+            if written >= len(head):
+                written -= len(head)
+                start += 1
+            else:
+                views[start] = head[written:]
+                written = 0
+
+
+def _run_writes(filename: str, writes: List[Callable[[str], Any]]) -> None:
+    """
+    Run the writes for one output file, in order.
+    
+    Args:
+        filename: The output file the writes produce.
+        writes: The write callables, each called with the filename.
+    """
+    for write in writes:
+        write(filename)
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize objects the json module does not handle natively.
+    
+    Steps share read-only template tables (types.MappingProxyType) between
+    outputs; these, and any other mappings, are written as JSON objects.
+    
+    Args:
+        obj: The object json.dump could not serialize.
+        
+    Returns:
+        Any: A JSON-serializable equivalent of the object.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """
+    Serialize data as compact UTF-8 JSON.
+    
+    Matches write_output_json with indent=None: non-ASCII text is written
+    as-is and there are no spaces after separators. Uses orjson when it is
+    installed.
+    
+    Args:
+        data: The JSON-serializable data.
+        
+    Returns:
+        bytes: The encoded document, without a trailing newline.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def _load_json_file(file_path: str) -> Any:
+    """
+    Parse a JSON file.
+    
+    With orjson available the file is memory-mapped and parsed straight from the
+    mapping, so its contents are never copied into an intermediate bytes/str object.
+    
+    Args:
+        file_path: The path to the JSON file.
+        
+    Returns:
+        Any: The parsed JSON document.
+    """
+    if orjson is None:
+        with open(file_path, "rb") as f:
+            return json.loads(f.read())
+    
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            # mmap refuses empty files; let the parser report the empty document
+            return orjson.loads(b"")
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+    finally:
+        os.close(fd)
+
+
+# Output subdirectory holding the outputs of a step's last run, keyed by input hash
+_OUTPUT_CACHE_DIR = ".cache"
+
+
+# Maps spaces in a lowercased member name to the underscores used in output filenames
+_SLUG_TABLE = str.maketrans({" ": "_"})
+
+
+# Parsed JSON documents shared between steps: absolute path -> (mtime_ns, size, document)
+_JSON_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+
 class StepBase:
-    """Base class for all agent steps"""
+    """
+    Base class for all agent steps.
+    
+    Deliberately a plain class rather than an ABC: constructing a step skips
+    the abstract-method check, and a step that does not override execute()
+    fails when it is run instead.
+    """
     
     def __init__(self, step_id: str, input_dir: str, output_dir: str):
         self.step_id = step_id
         self.input_dir = input_dir
         self.output_dir = output_dir
+        # Debug runs pretty-print JSON outputs for human review; compact JSON otherwise
+        self.debug = os.environ.get("AGENT_DEBUG", "").lower() in ("1", "true")
     
     def execute(self) -> bool:
         """
@@ -45,6 +203,18 @@ class StepBase:
         """
         return os.path.join(self.output_dir, filename)
     
+    def member_slug(self, name: str) -> str:
+        """
+        Convert a member name to the filename prefix used for their outputs.
+        
+        Args:
+            name: The member's display name.
+            
+        Returns:
+            str: The lowercased name with spaces replaced by underscores.
+        """
+        return name.lower().translate(_SLUG_TABLE)
+    
     def list_input_files(self) -> list:
         """
         List all files in the input directory.
@@ -95,6 +265,56 @@ class StepBase:
             logger.error(f"OS error reading input file {file_path}: {e}")
             return default
     
+    def read_json_cached(self, file_path: Union[str, os.PathLike]) -> Any:
+        """
+        Read and parse a JSON file, reusing an earlier parse while the file is unchanged.
+        
+        Meant for files that several steps read within one pipeline run (e.g.
+        another step's output). The parse is cached per process and validated
+        against the file's modification time and size, so later readers only
+        pay for a stat. The returned document is shared: callers must not
+        modify it.
+        
+        Args:
+            file_path: The path to the JSON file.
+            
+        Returns:
+            Any: The parsed JSON document.
+            
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not valid JSON.
+        """
+        file_path = os.path.abspath(file_path)
+        st = os.stat(file_path)
+        
+        entry = _JSON_CACHE.get(file_path)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        
+        document = _load_json_file(file_path)
+        _JSON_CACHE[file_path] = (st.st_mtime_ns, st.st_size, document)
+        return document
+    
+    def parse_json(self, data: bytes) -> Any:
+        """
+        Parse a JSON document that has already been read into memory.
+        
+        For steps that need the raw bytes of an input anyway (e.g. to hash them
+        into a cache key); files that are only parsed should be read with
+        read_json_cached instead. Parsed with orjson when it is installed.
+        
+        Args:
+            data: The UTF-8 encoded JSON document.
+            
+        Returns:
+            Any: The parsed JSON document.
+            
+        Raises:
+            ValueError: If the data is not valid JSON.
+        """
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    
     def write_output_file(self, filename: str, content: str) -> None:
         """
         Write content to an output file.
@@ -103,18 +323,176 @@ class StepBase:
             filename: The name of the output file.
             content: The content to write to the file.
         """
+        self.write_output_file_parts(filename, (content,))
+    
+    def write_output_file_parts(self, filename: str, parts: Iterable[Union[str, bytes]]) -> None:
+        """
+        Write several segments to an output file as one document.
+        
+        Lets callers that assemble output from pieces (e.g. a header and a body)
+        skip concatenating them first: the segments are handed to the kernel in a
+        single vectored write. str segments are encoded as UTF-8.
+        
+        Args:
+            filename: The name of the output file.
+            parts: The str or bytes-like segments to write, in order.
+        """
         file_path = self.get_output_path(filename)
         
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            buffers = [part.encode("utf-8") if isinstance(part, str) else part for part in parts]
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0), 0o644)
+            try:
+                _write_all(fd, buffers)
+            finally:
+                os.close(fd)
         except UnicodeError as e:
             logger.error(f"UnicodeError writing output file {file_path}: {e}")
         except OSError as e: # Catches IOError as well
             logger.error(f"OS error writing output file {file_path}: {e}")
     
+    def write_output_bytes(self, filename: str, data: bytes) -> None:
+        """
+        Write already-encoded bytes to an output file.
+        
+        For content that is produced as bytes (e.g. orjson.dumps), which skips
+        building a str only to encode it again. The file is written through a
+        raw file descriptor without an intermediate buffer copy.
+        
+        Args:
+            filename: The name of the output file.
+            data: The bytes-like content to write.
+        """
+        self.write_output_file_parts(filename, (data,))
+    
+    def write_output_file_iter(self, filename: str, chunks: Iterable[str]) -> None:
+        """
+        Write text chunks to an output file as they are produced.
+        
+        Pairs with generators that yield a document piece by piece: the chunks
+        go through a 1 MiB write buffer, so the whole document never has to
+        exist as one string.
+        
+        Args:
+            filename: The name of the output file.
+            chunks: The text chunks to write, in order.
+        """
+        file_path = self.get_output_path(filename)
+        
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        
+        try:
+            with open(file_path, "w", encoding="utf-8", buffering=_STREAM_BUFFER_SIZE) as f:
+                f.writelines(chunks)
+        except UnicodeError as e:
+            logger.error(f"UnicodeError writing output file {file_path}: {e}")
+        except OSError as e: # Catches IOError as well
+            logger.error(f"OS error writing output file {file_path}: {e}")
+    
+    def write_output_json(self, filename: str, data: Any, indent: Optional[int] = 2) -> None:
+        """
+        Serialize data as JSON into an output file.
+        
+        With orjson installed (and an indent of 2 or None) the document is
+        serialized straight to UTF-8 bytes in one pass and handed to
+        write_output_bytes. Otherwise json.dump streams it to the file through
+        a 1 MiB buffer. Both produce the same bytes: non-ASCII text is written
+        as-is, and compact output has no spaces after separators. Read-only
+        mappings such as MappingProxyType are written as objects.
+        
+        Args:
+            filename: The name of the output file.
+            data: The JSON-serializable data to write.
+            indent: The indentation level, or None for compact output.
+        """
+        file_path = self.get_output_path(filename)
+        
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        
+        try:
+            if orjson is not None and indent in (None, 2):
+                option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+                self.write_output_bytes(filename, orjson.dumps(data, default=_json_default, option=option))
+            else:
+                with open(file_path, "w", encoding="utf-8", buffering=_STREAM_BUFFER_SIZE) as f:
+                    json.dump(
+                        data,
+                        f,
+                        indent=indent,
+                        separators=(",", ":") if indent is None else None,
+                        ensure_ascii=False,
+                        default=_json_default
+                    )
+        except UnicodeError as e:
+            logger.error(f"UnicodeError writing output file {file_path}: {e}")
+        except OSError as e: # Catches IOError as well
+            logger.error(f"OS error writing output file {file_path}: {e}")
+    
+    @contextmanager
+    def write_output_stream(self, filename: str) -> Iterator[TextIO]:
+        """
+        Open an output file for streaming writes.
+        
+        Use this instead of write_output_file when the content can be produced
+        incrementally (e.g. json.dump), so the whole document never has to exist
+        as one string. Unlike write_output_file, errors propagate to the caller
+        because the file may have been partially written.
+        
+        Args:
+            filename: The name of the output file.
+            
+        Yields:
+            TextIO: A UTF-8 text file object opened for writing.
+        """
+        file_path = self.get_output_path(filename)
+        
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        
+        with open(file_path, "w", encoding="utf-8", buffering=_STREAM_BUFFER_SIZE) as f:
+            yield f
+    
+    def write_outputs_concurrently(self, jobs: Sequence[Tuple[str, Callable[[str], Any]]]) -> bool:
+        """
+        Write several independent output files on a thread pool.
+        
+        Each job is a (filename, write) pair; write is called with the filename
+        and produces that file. Jobs that share a filename (e.g. two members
+        with the same name) are run one after another in the order given, so
+        the last one wins, as it would when writing sequentially.
+        
+        Every job runs even if another fails; OS errors raised by the jobs are
+        logged once all of them have finished.
+        
+        Args:
+            jobs: The (filename, write) pairs to run.
+            
+        Returns:
+            bool: True if every job succeeded, False if any failed with an OS error.
+        """
+        writes_by_file: Dict[str, List[Callable[[str], Any]]] = {}
+        for filename, write in jobs:
+            writes_by_file.setdefault(filename, []).append(write)
+        
+        if not writes_by_file:
+            return True
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(writes_by_file))) as executor:
+            futures = {
+                filename: executor.submit(_run_writes, filename, writes)
+                for filename, writes in writes_by_file.items()
+            }
+        
+        success = True
+        for filename, future in futures.items():
+            try:
+                future.result()
+            except OSError as e: # Catches IOError as well
+                logger.error(f"OS error writing output file {self.get_output_path(filename)}: {e}")
+                success = False
+        return success
+    
     def copy_input_to_output(self, filename: str) -> bool:
         """
         Copy an input file to the output directory.
@@ -146,3 +524,54 @@ class StepBase:
         except OSError as e: # Catches IOError as well
             logger.error(f"OS error copying file from {input_path} to {output_path}: {e}")
             return False
+    
+    def restore_cached_outputs(self, cache_key: str) -> bool:
+        """
+        Copy the outputs cached under the given key into the output directory.
+        
+        Steps whose outputs depend only on their inputs can hash the inputs
+        into a key and skip regeneration when this returns True.
+        
+        Args:
+            cache_key: A key identifying the inputs the outputs were generated from.
+            
+        Returns:
+            bool: True if cached outputs were restored, False on a cache miss or error.
+        """
+        cache_path = os.path.join(self.output_dir, _OUTPUT_CACHE_DIR, cache_key)
+        
+        if not os.path.isdir(cache_path):
+            return False
+        
+        try:
+            shutil.copytree(cache_path, self.output_dir, dirs_exist_ok=True)
+            return True
+        except OSError as e: # Also catches shutil.Error
+            logger.warning(f"Could not restore cached {self.step_id} outputs from {cache_path}: {e}")
+            return False
+    
+    def save_cached_outputs(self, cache_key: str, filenames: Iterable[str]) -> None:
+        """
+        Store copies of the generated outputs under the given key.
+        
+        Only the latest entry is kept, so the cache never holds more than one
+        set of outputs.
+        
+        Args:
+            cache_key: A key identifying the inputs the outputs were generated from.
+            filenames: The output files to cache.
+        """
+        cache_root = os.path.join(self.output_dir, _OUTPUT_CACHE_DIR)
+        cache_path = os.path.join(cache_root, cache_key)
+        # Build the entry under a temporary name so a partial copy is never treated as a hit
+        tmp_path = cache_path + ".tmp"
+        
+        try:
+            shutil.rmtree(cache_root, ignore_errors=True)
+            os.makedirs(tmp_path)
+            for filename in filenames:
+                shutil.copy2(self.get_output_path(filename), tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache {self.step_id} outputs in {cache_path}: {e}")
+            shutil.rmtree(tmp_path, ignore_errors=True)
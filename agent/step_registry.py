@@ -1,5 +1,7 @@
 """Registry of all step classes."""
 
+from types import MappingProxyType
+
 # Import all step classes
 from agent.steps.data_analysis.data_analysis import DataAnalysisStep
 from agent.steps.evaluation_generation.evaluation_generation import EvaluationGenerationStep
@@ -10,8 +12,8 @@ from agent.steps.update_development_item.update_development_item import UpdateDe
 from agent.steps.timely_feedback.timely_feedback import TimelyFeedbackStep
 from agent.steps.coaching.coaching import CoachingStep
 
-# Define a registry of all step classes
-STEP_REGISTRY = {
+# Canonical step ID -> step class mapping; edit this dict, not the read-only view below
+_STEP_CLASSES = {
     "data_analysis": DataAnalysisStep,
     "evaluation_generation": EvaluationGenerationStep,
     "create_contribution_goal": CreateContributionGoalStep,
@@ -22,6 +24,8 @@ STEP_REGISTRY = {
     "coaching": CoachingStep
 }
 
-def get_step_class(step_id):
-    """Get a step class by ID."""
-    return STEP_REGISTRY.get(step_id)
+# Read-only view of the registry shared with callers
+STEP_REGISTRY = MappingProxyType(_STEP_CLASSES)
+
+# Get a step class by ID (bound directly to avoid a wrapper frame per lookup)
+get_step_class = STEP_REGISTRY.get
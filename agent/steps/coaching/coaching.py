@@ -1,10 +1,268 @@
 import os
 import json
 import random
+import hashlib
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import chain
+from types import MappingProxyType
+from typing import Optional
 from agent.step_base import StepBase
 from loguru import logger
 
+# Markdown templates for the per-member coaching plan, filled from the plan dicts
+_PLAN_HEADER = (
+    "# Coaching Plan for {member_name}\n\n"
+    "**Role:** {role}\n\n"
+    "**Check-in Frequency:** {check_in_frequency}\n\n"
+)
+
+_AREA_BLOCK = (
+    "### {title}\n\n"
+    "**Type:** {type}\n\n"
+    "**Description:** {description}\n\n"
+    "**Current Status:** {current_status}\n\n"
+    "**Priority:** {priority}\n\n"
+)
+
+_SESSION_BLOCK = (
+    "#### Session {session_number}: {focus}\n\n"
+    "**Approach:** {approach}\n\n"
+    "**Duration:** {duration}\n\n"
+    "**Techniques:**\n\n"
+)
+
+_RESOURCE_BLOCK = "#### {title} ({type})\n\n{description}\n\n"
+
+_CHECK_IN_FREQUENCIES = ("Weekly", "Bi-weekly", "Monthly")
+
+# Possible focuses for the sessions between assessment and review
+_SESSION_FOCUSES = (
+    "Skill Development",
+    "Practical Application",
+    "Challenge Identification",
+    "Feedback and Adjustment"
+)
+
+# Session approach templates by session focus
+_SESSION_APPROACHES = MappingProxyType({
+    "Assessment and Goal Setting": "Assess current abilities in {area_title} and set specific, measurable goals for improvement.",
+    "Progress Review and Next Steps": "Review progress in {area_title}, celebrate wins, and identify ongoing development opportunities.",
+    "Skill Development": "Focus on building specific skills related to {area_title} through targeted exercises.",
+    "Practical Application": "Apply learning from previous sessions to current work projects involving {area_title}.",
+    "Challenge Identification": "Identify and address specific challenges in applying {area_title} skills.",
+    "Feedback and Adjustment": "Gather feedback on recent work related to {area_title} and adjust development approach."
+})
+
+# Coaching techniques by focus area type
+_TECHNIQUES_BY_TYPE = MappingProxyType({
+    "Technical Skill": ("Guided practice", "Expert shadowing", "Case study analysis", "Code/design review"),
+    "Leadership": ("Role playing", "Scenario planning", "360-degree feedback discussion", "Leadership assessment"),
+    "Communication": ("Recorded practice presentations", "Feedback analysis", "Communication style assessment", "Stakeholder mapping")
+})
+
+_DEFAULT_TECHNIQUES = ("Goal setting", "Progress review", "Action planning", "Reflection exercises")
+
+# Preparation step templates by session focus
+_PREP_BY_FOCUS = MappingProxyType({
+    "Assessment and Goal Setting": (
+        "Complete self-assessment of current skills in {area_title}",
+        "Identify 2-3 specific situations where improvement would have the most impact",
+        "Review relevant performance feedback from past evaluations"
+    ),
+    "Skill Development": (
+        "Complete pre-reading on assigned topics",
+        "Prepare examples of recent work for discussion",
+        "Identify specific questions about applying new skills"
+    ),
+    "Practical Application": (
+        "Select a current project to apply new skills",
+        "Document specific challenges in applying skills",
+        "Prepare draft work product for review"
+    ),
+    "Progress Review and Next Steps": (
+        "Reflect on progress made since coaching began",
+        "Identify ongoing challenges and support needed",
+        "Draft goals for continued development"
+    )
+})
+
+_DEFAULT_PREP = (
+    "Review notes from previous sessions",
+    "Prepare specific examples or questions",
+    "Complete any assigned activities"
+)
+
+# Role-specific preparation step added to every session
+_ROLE_PREP_STEP = MappingProxyType({
+    "Software Engineer": "Bring code samples or system designs for discussion",
+    "UX Designer": "Bring design artifacts or user research findings",
+    "Product Manager": "Bring product requirements or prioritization examples",
+    "Data Scientist": "Bring data analysis examples or model documentation",
+    "DevOps Engineer": "Bring infrastructure diagrams or automation scripts"
+})
+
+# Success metric templates by focus area type
+_METRIC_TEMPLATES_BY_TYPE = MappingProxyType({
+    "Technical Skill": (
+        "Demonstrated application of {area_title} in at least 2 projects",
+        "Peer feedback indicates improvement in {area_title}",
+        "Completion of all learning resources related to {area_title}"
+    ),
+    "Leadership": (
+        "Successfully led at least 1 initiative demonstrating {area_title}",
+        "Team feedback indicates improved {area_title}",
+        "Documented examples of applying {area_title} principles"
+    ),
+    "Communication": (
+        "Stakeholder feedback indicates improved clarity in {area_title}",
+        "Successfully delivered presentations demonstrating {area_title} skills",
+        "Reduced incidents of miscommunication in relevant contexts"
+    )
+})
+
+_DEFAULT_METRIC_TEMPLATES = (
+    "Demonstrated improvement in {area_title} based on manager feedback",
+    "Self-assessment indicates increased confidence in {area_title}",
+    "Application of {area_title} skills in day-to-day work"
+)
+
+# Generic coaching focus areas by role, used to top up plans with fewer than three areas
+_GENERIC_FOCUS_AREAS = MappingProxyType({
+    "Software Engineer": (
+        {"title": "Code Review Skills", "type": "Technical Skill", "description": "Improve ability to provide and receive code review feedback effectively."},
+        {"title": "System Design", "type": "Technical Skill", "description": "Develop skills in designing scalable and maintainable systems."},
+        {"title": "Technical Communication", "type": "Communication", "description": "Enhance ability to communicate technical concepts to non-technical stakeholders."}
+    ),
+    "UX Designer": (
+        {"title": "User Research Methods", "type": "Technical Skill", "description": "Expand toolkit of user research methodologies and techniques."},
+        {"title": "Design Systems", "type": "Technical Skill", "description": "Develop expertise in creating and maintaining design systems."},
+        {"title": "Cross-functional Collaboration", "type": "Communication", "description": "Improve collaboration with engineering and product teams."}
+    ),
+    "Product Manager": (
+        {"title": "Data-driven Decision Making", "type": "Technical Skill", "description": "Enhance ability to use data to inform product decisions."},
+        {"title": "Stakeholder Management", "type": "Leadership", "description": "Improve skills in managing diverse stakeholder expectations."},
+        {"title": "Technical Understanding", "type": "Technical Skill", "description": "Deepen technical knowledge to better collaborate with engineering."}
+    ),
+    "Data Scientist": (
+        {"title": "Business Impact Communication", "type": "Communication", "description": "Improve ability to communicate the business impact of data insights."},
+        {"title": "Advanced Modeling Techniques", "type": "Technical Skill", "description": "Expand knowledge of advanced modeling approaches."},
+        {"title": "Data Storytelling", "type": "Communication", "description": "Enhance ability to create compelling narratives from data."}
+    ),
+    "DevOps Engineer": (
+        {"title": "Security Best Practices", "type": "Technical Skill", "description": "Deepen knowledge of security best practices in infrastructure."},
+        {"title": "Incident Management", "type": "Technical Skill", "description": "Improve skills in managing and resolving production incidents."},
+        {"title": "Cross-team Collaboration", "type": "Communication", "description": "Enhance ability to collaborate with development teams on infrastructure needs."}
+    )
+})
+
+_DEFAULT_GENERIC_FOCUS_AREAS = (
+    {"title": "Project Management", "type": "Leadership", "description": "Develop skills in managing project timelines and resources."},
+    {"title": "Stakeholder Communication", "type": "Communication", "description": "Improve communication with diverse stakeholders."},
+    {"title": "Strategic Thinking", "type": "Leadership", "description": "Enhance ability to think strategically about long-term goals."}
+)
+
+# Book recommendations by role
+_ROLE_BOOKS = MappingProxyType({
+    "Software Engineer": (
+        "Clean Code by Robert Martin",
+        "Designing Data-Intensive Applications by Martin Kleppmann",
+        "Refactoring by Martin Fowler",
+        "The Pragmatic Programmer by Andrew Hunt and David Thomas"
+    ),
+    "UX Designer": (
+        "Don't Make Me Think by Steve Krug",
+        "The Design of Everyday Things by Don Norman",
+        "About Face: The Essentials of Interaction Design by Alan Cooper",
+        "Universal Principles of Design by William Lidwell"
+    ),
+    "Product Manager": (
+        "Inspired: How to Create Products Customers Love by Marty Cagan",
+        "Hooked: How to Build Habit-Forming Products by Nir Eyal",
+        "Escaping the Build Trap by Melissa Perri",
+        "The Lean Product Playbook by Dan Olsen"
+    ),
+    "Data Scientist": (
+        "Storytelling with Data by Cole Nussbaumer Knaflic",
+        "Hands-On Machine Learning with Scikit-Learn and TensorFlow by Aurélien Géron",
+        "Python for Data Analysis by Wes McKinney",
+        "Data Science for Business by Foster Provost and Tom Fawcett"
+    ),
+    "DevOps Engineer": (
+        "The Phoenix Project by Gene Kim",
+        "Site Reliability Engineering by Niall Richard Murphy",
+        "Continuous Delivery by Jez Humble and David Farley",
+        "Infrastructure as Code by Kief Morris"
+    )
+})
+
+_DEFAULT_BOOKS = (
+    "The Five Dysfunctions of a Team by Patrick Lencioni",
+    "Crucial Conversations by Kerry Patterson",
+    "Drive by Daniel Pink",
+    "Mindset by Carol Dweck"
+)
+
+# Online course title templates by focus area type ({area_title} is filled in per area)
+_ONLINE_COURSES = MappingProxyType({
+    "Technical Skill": (
+        "{area_title} Fundamentals on Coursera",
+        "Advanced {area_title} on Udemy",
+        "Practical {area_title} on Pluralsight",
+        "{area_title} Masterclass on LinkedIn Learning"
+    ),
+    "Leadership": (
+        "Leadership Strategies for Tomorrow's Leaders on Coursera",
+        "Developing Leadership Presence on LinkedIn Learning",
+        "Strategic Leadership Skills on Udemy",
+        "Executive Leadership Program on edX"
+    ),
+    "Communication": (
+        "Effective Communication Skills for Professionals on Coursera",
+        "Strategic Communication on LinkedIn Learning",
+        "Advanced Presentation Skills on Udemy",
+        "Communication that Drives Results on edX"
+    ),
+    "Feedback Response": (
+        "Receiving and Implementing Feedback on Coursera",
+        "Feedback as a Tool for Growth on LinkedIn Learning",
+        "Transforming Feedback into Action on Udemy",
+        "The Art of Effective Feedback on edX"
+    )
+})
+
+_DEFAULT_ONLINE_COURSES = (
+    "{area_title} Skills Development on Coursera",
+    "Professional {area_title} on LinkedIn Learning",
+    "Mastering {area_title} on Udemy",
+    "Applied {area_title} on edX"
+)
+
+# Internal resource templates ({area_title} is filled in per area)
+_INTERNAL_RESOURCES = (
+    {
+        "type": "Internal Workshop",
+        "title": "{area_title} Best Practices Workshop",
+        "description": "Interactive session with internal experts"
+    },
+    {
+        "type": "Mentorship",
+        "title": "Mentorship with {area_title} Expert",
+        "description": "1:1 sessions with an experienced colleague"
+    },
+    {
+        "type": "Practice Group",
+        "title": "{area_title} Community of Practice",
+        "description": "Regular meetings with others developing similar skills"
+    },
+    {
+        "type": "Knowledge Base",
+        "title": "Internal {area_title} Documentation",
+        "description": "Company-specific best practices and examples"
+    }
+)
+
 class CoachingStep(StepBase):
     """
     Implementation of the Coaching step.
@@ -12,6 +270,11 @@ class CoachingStep(StepBase):
     This step generates coaching plans and resources based on development needs and feedback.
     """
     
+    def __init__(self, step_id: str, input_dir: str, output_dir: str):
+        super().__init__(step_id, input_dir, output_dir)
+        # Private generator, so draws skip the module-level random functions' shared state
+        self._rng = random.Random()
+    
     def execute(self) -> bool:
         """
         Execute the step.
@@ -21,102 +284,140 @@ class CoachingStep(StepBase):
         """
         logger.info("Executing Coaching step")
         
-        # Read updated development items from previous step
-        development_items_path = os.path.join(
-            os.path.dirname(os.path.dirname(self.input_dir)),
-            "update_development_item",
-            "out",
-            "updated_development_items.json"
-        )
+        # Sibling step directories share the parent of this step's directory
+        steps_dir = os.path.dirname(os.path.dirname(self.input_dir))
         
-        # If updated development items aren't available, try the original development items
-        if not os.path.exists(development_items_path):
-            development_items_path = os.path.join(
-                os.path.dirname(os.path.dirname(self.input_dir)),
-                "create_development_item",
-                "out",
-                "development_items.json"
-            )
+        # Read updated development items from previous step, falling back to the
+        # original development items if they aren't available
+        updated_items_path = os.path.join(steps_dir, "update_development_item", "out", "updated_development_items.json")
+        original_items_path = os.path.join(steps_dir, "create_development_item", "out", "development_items.json")
+        development_items_path = updated_items_path if os.path.exists(updated_items_path) else original_items_path
         
         if not os.path.exists(development_items_path):
             logger.error("Development items not found. Please run create_development_item or update_development_item step first.")
             return False
         
         # Also read the timely feedback if available
-        feedback_path = os.path.join(
-            os.path.dirname(os.path.dirname(self.input_dir)),
-            "timely_feedback",
-            "out",
-            "timely_feedback.json"
-        )
+        feedback_path = os.path.join(steps_dir, "timely_feedback", "out", "timely_feedback.json")
         
-        feedback_data = None
+        # Read the raw inputs first; their bytes key the output cache
+        feedback_bytes = None
         if os.path.exists(feedback_path):
             try:
-                with open(feedback_path, "r", encoding="utf-8") as f:
-                    feedback_data = json.load(f)
-            except FileNotFoundError:
-                logger.error(f"Feedback file not found at {feedback_path}")
-                # Continue without feedback data if not found, as it's optional
+                with open(feedback_path, "rb") as f:
+                    feedback_bytes = f.read()
+            except OSError as e:
+                logger.error(f"An OS error occurred while reading {feedback_path}: {e}")
+                # Continue without feedback data on OS errors, as it's optional
+        
+        try:
+            with open(development_items_path, "rb") as f:
+                development_bytes = f.read()
+        except OSError as e:
+            logger.error(f"An OS error occurred while reading {development_items_path}: {e}")
+            return False
+        
+        # The run date is stamped into the summary, so it is part of the cache key
+        run_date = datetime.now().date().isoformat()
+        
+        # Unchanged inputs produce the same outputs, so reuse them if cached
+        cache_key = self._cache_key(development_bytes, feedback_bytes, run_date)
+        if self.restore_cached_outputs(cache_key):
+            logger.info("Coaching inputs unchanged, reusing cached outputs")
+            return True
+        
+        feedback_data = None
+        if feedback_bytes is not None:
+            try:
+                feedback_data = self.parse_json(feedback_bytes)
             except json.JSONDecodeError:
                 logger.error(f"Error decoding JSON from {feedback_path}")
                 # Continue without feedback data if JSON is invalid
-            except OSError as e:
-                logger.error(f"An OS error occurred while reading {feedback_path}: {e}")
-                # Continue without feedback data on other OS errors
         
         # Load development items
         try:
-            with open(development_items_path, "r", encoding="utf-8") as f:
-                development_items = json.load(f)
-        except FileNotFoundError:
-            logger.error(f"Development items file not found at {development_items_path}")
-            return False
+            development_items = self.parse_json(development_bytes)
         except json.JSONDecodeError:
             logger.error(f"Error decoding JSON from {development_items_path}")
             return False
-        except OSError as e:
-            logger.error(f"An OS error occurred while reading {development_items_path}: {e}")
-            return False
+        
+        # Seed from the cache key so the same inputs always produce the same plans
+        self._rng.seed(int(cache_key[:16], 16))
         
         # Generate coaching plans
         coaching_plans = self._generate_coaching_plans(development_items, feedback_data)
         
         # Write coaching plans to output
-        self.write_output_file("coaching_plans.json", json.dumps(coaching_plans, indent=2))
-        
-        # Also write a markdown summary for each team member
-        for member_plan in coaching_plans:
-            member_name = member_plan["member_name"].replace(" ", "_").lower()
-            self.write_output_file(
-                f"{member_name}_coaching_plan.md",
-                self._generate_coaching_markdown(member_plan)
-            )
+        self.write_output_json("coaching_plans.json", coaching_plans, indent=2 if self.debug else None)
+        output_files = ["coaching_plans.json"]
+        
+        # Also write a markdown summary for each team member; the files are
+        # independent, so overlap their writes
+        member_jobs = [
+            (f"{self.member_slug(member_plan['member_name'])}_coaching_plan.md",
+             partial(self._write_member_plan, member_plan))
+            for member_plan in coaching_plans
+        ]
+        if not self.write_outputs_concurrently(member_jobs):
+            return False
+        output_files.extend(filename for filename, _ in member_jobs)
         
         # Write a summary markdown file
         self.write_output_file(
             "coaching_summary.md",
-            self._generate_summary_markdown(coaching_plans)
+            self._generate_summary_markdown(coaching_plans, run_date)
         )
+        output_files.append("coaching_summary.md")
+        
+        self.save_cached_outputs(cache_key, output_files)
         
         return True
     
+    def _cache_key(self, development_bytes: bytes, feedback_bytes: Optional[bytes], run_date: str) -> str:
+        """
+        Compute the output cache key for a set of inputs.
+        
+        Besides the input contents, the key covers the JSON formatting mode and
+        the run date, since both show up in the outputs.
+        
+        Args:
+            development_bytes: The raw development items JSON.
+            feedback_bytes: The raw timely feedback JSON, or None if unavailable.
+            run_date: The ISO date stamped into the summary.
+            
+        Returns:
+            str: The hex SHA-256 digest identifying the outputs.
+        """
+        hasher = hashlib.sha256(development_bytes)
+        hasher.update(b"|")
+        hasher.update(feedback_bytes or b"")
+        hasher.update(f"|{self.debug}|{run_date}".encode("utf-8"))
+        return hasher.hexdigest()
+    
+    def _write_member_plan(self, member_plan: dict, filename: str) -> None:
+        """
+        Write the markdown coaching plan for one team member.
+        
+        Args:
+            member_plan: The member's coaching plan.
+            filename: The name of the output file.
+        """
+        self.write_output_file(filename, self._generate_coaching_markdown(member_plan))
+    
     def _generate_coaching_plans(self, development_items, feedback_data=None):
         """Generate coaching plans for each team member"""
         coaching_plans = []
         
+        # Index feedback by member ID (reversed so the first entry wins on duplicates)
+        feedback_by_id = {f["member"]["id"]: f for f in reversed(feedback_data)} if feedback_data else {}
+        
         for member_items in development_items:
             member_id = member_items["member_id"]
             member_name = member_items["member_name"]
             role = member_items["role"]
             
             # Get feedback for this member if available
-            member_feedback = None
-            if feedback_data:
-                member_feedback = next(
-                    (f for f in feedback_data if f["member"]["id"] == member_id),
-                    None
-                )
+            member_feedback = feedback_by_id.get(member_id)
             
             # Generate coaching focus areas
             focus_areas = self._generate_focus_areas(member_items, member_feedback)
@@ -135,7 +436,7 @@ class CoachingStep(StepBase):
                 "focus_areas": focus_areas,
                 "coaching_sessions": coaching_sessions,
                 "resources": resources,
-                "check_in_frequency": random.choice(["Weekly", "Bi-weekly", "Monthly"]),
+                "check_in_frequency": self._rng.choice(_CHECK_IN_FREQUENCIES),
                 "success_metrics": self._generate_success_metrics(focus_areas) # Removed role argument
             }
             
@@ -150,17 +451,21 @@ class CoachingStep(StepBase):
         # Extract areas from development items
         items = member_items.get("items", [])
         
-        # If we have updated development items, prioritize those that need modification
-        items_needing_modification = [
-            item for item in items 
-            if item.get("needs_modification", False)
-        ]
+        # If we have updated development items, prioritize those that need
+        # modification, stopping once the top 2 are found
+        prioritized_items = []
+        for item in items:
+            if item.get("needs_modification", False):
+                prioritized_items.append(item)
+                if len(prioritized_items) == 2:
+                    break
         
-        # If we have items needing modification, prioritize those
-        prioritized_items = items_needing_modification if items_needing_modification else items
+        # Otherwise fall back to the first items
+        if not prioritized_items:
+            prioritized_items = items[:2]
         
         # Extract focus areas from development items
-        for item in prioritized_items[:2]:  # Limit to top 2 items
+        for item in prioritized_items:  # Limited to top 2 items
             focus_areas.append({
                 "title": item["title"],
                 "type": item["type"],
@@ -189,47 +494,15 @@ class CoachingStep(StepBase):
                 })
         
         # If we still have fewer than 3 focus areas, add generic ones
-        role = member_items["role"]
-        generic_focus_areas = {
-            "Software Engineer": [
-                {"title": "Code Review Skills", "type": "Technical Skill", "description": "Improve ability to provide and receive code review feedback effectively."},
-                {"title": "System Design", "type": "Technical Skill", "description": "Develop skills in designing scalable and maintainable systems."},
-                {"title": "Technical Communication", "type": "Communication", "description": "Enhance ability to communicate technical concepts to non-technical stakeholders."}
-            ],
-            "UX Designer": [
-                {"title": "User Research Methods", "type": "Technical Skill", "description": "Expand toolkit of user research methodologies and techniques."},
-                {"title": "Design Systems", "type": "Technical Skill", "description": "Develop expertise in creating and maintaining design systems."},
-                {"title": "Cross-functional Collaboration", "type": "Communication", "description": "Improve collaboration with engineering and product teams."}
-            ],
-            "Product Manager": [
-                {"title": "Data-driven Decision Making", "type": "Technical Skill", "description": "Enhance ability to use data to inform product decisions."},
-                {"title": "Stakeholder Management", "type": "Leadership", "description": "Improve skills in managing diverse stakeholder expectations."},
-                {"title": "Technical Understanding", "type": "Technical Skill", "description": "Deepen technical knowledge to better collaborate with engineering."}
-            ],
-            "Data Scientist": [
-                {"title": "Business Impact Communication", "type": "Communication", "description": "Improve ability to communicate the business impact of data insights."},
-                {"title": "Advanced Modeling Techniques", "type": "Technical Skill", "description": "Expand knowledge of advanced modeling approaches."},
-                {"title": "Data Storytelling", "type": "Communication", "description": "Enhance ability to create compelling narratives from data."}
-            ],
-            "DevOps Engineer": [
-                {"title": "Security Best Practices", "type": "Technical Skill", "description": "Deepen knowledge of security best practices in infrastructure."},
-                {"title": "Incident Management", "type": "Technical Skill", "description": "Improve skills in managing and resolving production incidents."},
-                {"title": "Cross-team Collaboration", "type": "Communication", "description": "Enhance ability to collaborate with development teams on infrastructure needs."}
-            ]
-        }
-        
-        # Get generic focus areas for the role (use default if role not found)
-        role_focus_areas = generic_focus_areas.get(role, [
-            {"title": "Project Management", "type": "Leadership", "description": "Develop skills in managing project timelines and resources."},
-            {"title": "Stakeholder Communication", "type": "Communication", "description": "Improve communication with diverse stakeholders."},
-            {"title": "Strategic Thinking", "type": "Leadership", "description": "Enhance ability to think strategically about long-term goals."}
-        ])
-        
-        # Add generic focus areas if needed
-        while len(focus_areas) < 3:
-            # Pick a random generic area that's not already included
-            generic_area = random.choice(role_focus_areas)
-            if not any(area["title"] == generic_area["title"] for area in focus_areas):
+        # (use default if role not found)
+        role_focus_areas = _GENERIC_FOCUS_AREAS.get(member_items["role"], _DEFAULT_GENERIC_FOCUS_AREAS)
+        
+        # Add generic focus areas if needed, picking only ones not already included
+        needed = 3 - len(focus_areas)
+        if needed > 0:
+            present = {area["title"] for area in focus_areas}
+            candidates = [area for area in role_focus_areas if area["title"] not in present]
+            for generic_area in self._rng.sample(candidates, min(needed, len(candidates))):
                 generic_area_copy = generic_area.copy()
                 generic_area_copy["current_status"] = "Not Started"
                 generic_area_copy["priority"] = "Medium"
@@ -240,50 +513,31 @@ class CoachingStep(StepBase):
     def _generate_coaching_sessions(self, focus_areas, role):
         """Generate coaching sessions based on focus areas"""
         coaching_sessions = []
+        _randint = self._rng.randint
+        _sample = self._rng.sample
         
         for _, area in enumerate(focus_areas): # Replaced i with _
             # Generate 2-3 sessions per focus area
-            num_sessions = random.randint(2, 3)
+            num_sessions = _randint(2, 3)
             area_title = area["title"]
             area_type = area["type"]
             
+            # Draw the focus of every middle session at once
+            middle_focuses = self._rng.choices(_SESSION_FOCUSES, k=num_sessions - 2)
+            
+            # Coaching techniques depend only on the area type
+            techniques = _TECHNIQUES_BY_TYPE.get(area_type, _DEFAULT_TECHNIQUES)
+            
             for j in range(num_sessions):
                 # Determine session focus based on session number
                 if j == 0:
                     session_focus = "Assessment and Goal Setting"
-                    approach = f"Assess current abilities in {area_title} and set specific, measurable goals for improvement."
                 elif j == num_sessions - 1:
                     session_focus = "Progress Review and Next Steps"
-                    approach = f"Review progress in {area_title}, celebrate wins, and identify ongoing development opportunities."
                 else:
                     # Middle sessions focus on skill development
-                    session_focuses = [
-                        "Skill Development", 
-                        "Practical Application", 
-                        "Challenge Identification", 
-                        "Feedback and Adjustment"
-                    ]
-                    session_focus = random.choice(session_focuses)
-                    
-                    if session_focus == "Skill Development":
-                        approach = f"Focus on building specific skills related to {area_title} through targeted exercises."
-                    elif session_focus == "Practical Application":
-                        approach = f"Apply learning from previous sessions to current work projects involving {area_title}."
-                    elif session_focus == "Challenge Identification":
-                        approach = f"Identify and address specific challenges in applying {area_title} skills."
-                    else:
-                        approach = f"Gather feedback on recent work related to {area_title} and adjust development approach."
-                
-                # Generate coaching techniques based on area type
-                techniques = []
-                if area_type == "Technical Skill":
-                    techniques = ["Guided practice", "Expert shadowing", "Case study analysis", "Code/design review"]
-                elif area_type == "Leadership":
-                    techniques = ["Role playing", "Scenario planning", "360-degree feedback discussion", "Leadership assessment"]
-                elif area_type == "Communication":
-                    techniques = ["Recorded practice presentations", "Feedback analysis", "Communication style assessment", "Stakeholder mapping"]
-                else:
-                    techniques = ["Goal setting", "Progress review", "Action planning", "Reflection exercises"]
+                    session_focus = middle_focuses[j - 1]
+                approach = _SESSION_APPROACHES[session_focus].format(area_title=area_title)
                 
                 # Create the session
                 session = {
@@ -292,8 +546,8 @@ class CoachingStep(StepBase):
                     "session_number": j+1,
                     "focus": session_focus,
                     "approach": approach,
-                    "duration": f"{random.randint(30, 60)} minutes",
-                    "techniques": random.sample(techniques, min(2, len(techniques))),
+                    "duration": f"{_randint(30, 60)} minutes",
+                    "techniques": _sample(techniques, min(2, len(techniques))),
                     "preparation": self._generate_preparation_steps(area_title, session_focus, role)
                 }
                 
@@ -306,57 +560,36 @@ class CoachingStep(StepBase):
     
     def _generate_preparation_steps(self, area_title, session_focus, role):
         """Generate preparation steps for coaching sessions"""
-        preparation_steps = []
-        
-        if session_focus == "Assessment and Goal Setting":
-            preparation_steps = [
-                f"Complete self-assessment of current skills in {area_title}",
-                "Identify 2-3 specific situations where improvement would have the most impact",
-                "Review relevant performance feedback from past evaluations"
-            ]
-        elif session_focus == "Skill Development":
-            preparation_steps = [
-                "Complete pre-reading on assigned topics",
-                "Prepare examples of recent work for discussion",
-                "Identify specific questions about applying new skills"
-            ]
-        elif session_focus == "Practical Application":
-            preparation_steps = [
-                "Select a current project to apply new skills",
-                "Document specific challenges in applying skills",
-                "Prepare draft work product for review"
-            ]
-        elif session_focus == "Progress Review and Next Steps":
-            preparation_steps = [
-                "Reflect on progress made since coaching began",
-                "Identify ongoing challenges and support needed",
-                "Draft goals for continued development"
-            ]
-        else:
-            preparation_steps = [
-                "Review notes from previous sessions",
-                "Prepare specific examples or questions",
-                "Complete any assigned activities"
-            ]
+        preparation_steps = self._preparation_candidates(area_title, session_focus, role)
+        
+        # Select a subset of preparation steps
+        return self._rng.sample(preparation_steps, min(3, len(preparation_steps)))
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _preparation_candidates(area_title, session_focus, role):
+        """Build the preparation steps a session draws from (cached, as sessions repeat them)"""
+        preparation_steps = tuple(
+            step.format(area_title=area_title)
+            for step in _PREP_BY_FOCUS.get(session_focus, _DEFAULT_PREP)
+        )
         
         # Add a role-specific preparation step
-        if role == "Software Engineer":
-            preparation_steps.append("Bring code samples or system designs for discussion")
-        elif role == "UX Designer":
-            preparation_steps.append("Bring design artifacts or user research findings")
-        elif role == "Product Manager":
-            preparation_steps.append("Bring product requirements or prioritization examples")
-        elif role == "Data Scientist":
-            preparation_steps.append("Bring data analysis examples or model documentation")
-        elif role == "DevOps Engineer":
-            preparation_steps.append("Bring infrastructure diagrams or automation scripts")
+        role_step = _ROLE_PREP_STEP.get(role)
+        if role_step:
+            preparation_steps += (role_step,)
         
-        # Select a subset of preparation steps
-        return random.sample(preparation_steps, min(3, len(preparation_steps)))
+        return preparation_steps
     
     def _generate_resources(self, focus_areas, role):
         """Generate resources for each focus area"""
         resources = []
+        _choice = self._rng.choice
+        _randint = self._rng.randint
+        _sample = self._rng.sample
+        
+        # Books depend only on the role (use generic if role not found)
+        role_books = _ROLE_BOOKS.get(role, _DEFAULT_BOOKS)
         
         for area in focus_areas:
             area_title = area["title"]
@@ -366,120 +599,30 @@ class CoachingStep(StepBase):
             area_resources = []
             
             # Add a book recommendation
-            books = {
-                "Software Engineer": [
-                    "Clean Code by Robert Martin",
-                    "Designing Data-Intensive Applications by Martin Kleppmann",
-                    "Refactoring by Martin Fowler",
-                    "The Pragmatic Programmer by Andrew Hunt and David Thomas"
-                ],
-                "UX Designer": [
-                    "Don't Make Me Think by Steve Krug",
-                    "The Design of Everyday Things by Don Norman",
-                    "About Face: The Essentials of Interaction Design by Alan Cooper",
-                    "Universal Principles of Design by William Lidwell"
-                ],
-                "Product Manager": [
-                    "Inspired: How to Create Products Customers Love by Marty Cagan",
-                    "Hooked: How to Build Habit-Forming Products by Nir Eyal",
-                    "Escaping the Build Trap by Melissa Perri",
-                    "The Lean Product Playbook by Dan Olsen"
-                ],
-                "Data Scientist": [
-                    "Storytelling with Data by Cole Nussbaumer Knaflic",
-                    "Hands-On Machine Learning with Scikit-Learn and TensorFlow by Aurélien Géron",
-                    "Python for Data Analysis by Wes McKinney",
-                    "Data Science for Business by Foster Provost and Tom Fawcett"
-                ],
-                "DevOps Engineer": [
-                    "The Phoenix Project by Gene Kim",
-                    "Site Reliability Engineering by Niall Richard Murphy",
-                    "Continuous Delivery by Jez Humble and David Farley",
-                    "Infrastructure as Code by Kief Morris"
-                ]
-            }
-            
-            # Add a book based on role and area type
-            role_books = books.get(role, [
-                "The Five Dysfunctions of a Team by Patrick Lencioni",
-                "Crucial Conversations by Kerry Patterson",
-                "Drive by Daniel Pink",
-                "Mindset by Carol Dweck"
-            ])
-            
             area_resources.append({
                 "type": "Book",
-                "title": random.choice(role_books),
+                "title": _choice(role_books),
                 "description": f"Comprehensive resource for developing {area_title} skills"
             })
             
             # Add an online course
-            online_courses = {
-                "Technical Skill": [
-                    f"{area_title} Fundamentals on Coursera",
-                    f"Advanced {area_title} on Udemy",
-                    f"Practical {area_title} on Pluralsight",
-                    f"{area_title} Masterclass on LinkedIn Learning"
-                ],
-                "Leadership": [
-                    "Leadership Strategies for Tomorrow's Leaders on Coursera",
-                    "Developing Leadership Presence on LinkedIn Learning",
-                    "Strategic Leadership Skills on Udemy",
-                    "Executive Leadership Program on edX"
-                ],
-                "Communication": [
-                    "Effective Communication Skills for Professionals on Coursera",
-                    "Strategic Communication on LinkedIn Learning",
-                    "Advanced Presentation Skills on Udemy",
-                    "Communication that Drives Results on edX"
-                ],
-                "Feedback Response": [
-                    "Receiving and Implementing Feedback on Coursera",
-                    "Feedback as a Tool for Growth on LinkedIn Learning",
-                    "Transforming Feedback into Action on Udemy",
-                    "The Art of Effective Feedback on edX"
-                ]
-            }
-            
-            area_courses = online_courses.get(area_type, [
-                f"{area_title} Skills Development on Coursera",
-                f"Professional {area_title} on LinkedIn Learning",
-                f"Mastering {area_title} on Udemy",
-                f"Applied {area_title} on edX"
-            ])
-            
+            area_courses = _ONLINE_COURSES.get(area_type, _DEFAULT_ONLINE_COURSES)
             area_resources.append({
                 "type": "Online Course",
-                "title": random.choice(area_courses),
+                "title": _choice(area_courses).format(area_title=area_title),
                 "description": f"Structured learning path for {area_title}"
             })
             
-            # Add internal resources
-            internal_resources = [
-                {
-                    "type": "Internal Workshop",
-                    "title": f"{area_title} Best Practices Workshop",
-                    "description": "Interactive session with internal experts"
-                },
-                {
-                    "type": "Mentorship",
-                    "title": f"Mentorship with {area_title} Expert",
-                    "description": "1:1 sessions with an experienced colleague"
-                },
-                {
-                    "type": "Practice Group",
-                    "title": f"{area_title} Community of Practice",
-                    "description": "Regular meetings with others developing similar skills"
-                },
+            # Add 1-2 internal resources
+            num_internal = _randint(1, 2)
+            area_resources.extend(
                 {
-                    "type": "Knowledge Base",
-                    "title": f"Internal {area_title} Documentation",
-                    "description": "Company-specific best practices and examples"
+                    "type": resource["type"],
+                    "title": resource["title"].format(area_title=area_title),
+                    "description": resource["description"]
                 }
-            ]
-            
-            # Add 1-2 internal resources
-            area_resources.extend(random.sample(internal_resources, random.randint(1, 2)))
+                for resource in _sample(_INTERNAL_RESOURCES, num_internal)
+            )
             
             # Create the resources entry
             resources.append({
@@ -498,141 +641,90 @@ class CoachingStep(StepBase):
             area_type = area["type"]
             
             # Generate metrics based on area type
-            if area_type == "Technical Skill":
-                metrics.append({
-                    "focus_area": area_title,
-                    "metrics": [
-                        f"Demonstrated application of {area_title} in at least 2 projects",
-                        f"Peer feedback indicates improvement in {area_title}",
-                        f"Completion of all learning resources related to {area_title}"
-                    ]
-                })
-            elif area_type == "Leadership":
-                metrics.append({
-                    "focus_area": area_title,
-                    "metrics": [
-                        f"Successfully led at least 1 initiative demonstrating {area_title}",
-                        f"Team feedback indicates improved {area_title}",
-                        f"Documented examples of applying {area_title} principles"
-                    ]
-                })
-            elif area_type == "Communication":
-                metrics.append({
-                    "focus_area": area_title,
-                    "metrics": [
-                        "Stakeholder feedback indicates improved clarity in {area_title}",
-                        f"Successfully delivered presentations demonstrating {area_title} skills",
-                        "Reduced incidents of miscommunication in relevant contexts" # Removed f-string
-                    ]
-                })
-            else:
-                metrics.append({
-                    "focus_area": area_title,
-                    "metrics": [
-                        f"Demonstrated improvement in {area_title} based on manager feedback",
-                        f"Self-assessment indicates increased confidence in {area_title}",
-                        f"Application of {area_title} skills in day-to-day work"
-                    ]
-                })
+            metrics.append({
+                "focus_area": area_title,
+                "metrics": [
+                    template.format(area_title=area_title)
+                    for template in _METRIC_TEMPLATES_BY_TYPE.get(area_type, _DEFAULT_METRIC_TEMPLATES)
+                ]
+            })
         
         return metrics
     
     def _generate_coaching_markdown(self, coaching_plan):
         """Generate a markdown report of the coaching plan for a team member"""
-        member_name = coaching_plan["member_name"]
-        role = coaching_plan["role"]
-        check_in_frequency = coaching_plan["check_in_frequency"]
-        
-        markdown = f"# Coaching Plan for {member_name}\n\n"
-        markdown += f"**Role:** {role}\n\n"
-        markdown += f"**Check-in Frequency:** {check_in_frequency}\n\n"
-        
-        markdown += "## Focus Areas\n\n"
-        for area in coaching_plan["focus_areas"]:
-            markdown += f"### {area['title']}\n\n"
-            markdown += f"**Type:** {area['type']}\n\n"
-            markdown += f"**Description:** {area['description']}\n\n"
-            markdown += f"**Current Status:** {area['current_status']}\n\n"
-            markdown += f"**Priority:** {area['priority']}\n\n"
-        
-        markdown += "## Coaching Sessions\n\n"
+        parts = [_PLAN_HEADER.format_map(coaching_plan)]
+        
+        parts.append("## Focus Areas\n\n")
+        parts.extend(_AREA_BLOCK.format_map(area) for area in coaching_plan["focus_areas"])
+        
+        parts.append("## Coaching Sessions\n\n")
         current_focus_area = None
         for session in coaching_plan["coaching_sessions"]:
             if session["focus_area"] != current_focus_area:
                 current_focus_area = session["focus_area"]
-                markdown += f"### {current_focus_area}\n\n"
-            
-            markdown += f"#### Session {session['session_number']}: {session['focus']}\n\n"
-            markdown += f"**Approach:** {session['approach']}\n\n"
-            markdown += f"**Duration:** {session['duration']}\n\n"
+                parts.append(f"### {current_focus_area}\n\n")
             
-            markdown += "**Techniques:**\n\n"
-            for technique in session["techniques"]:
-                markdown += f"- {technique}\n"
-            markdown += "\n"
-            
-            markdown += "**Preparation:**\n\n"
-            for step in session["preparation"]:
-                markdown += f"- {step}\n"
-            markdown += "\n"
+            parts.append(_SESSION_BLOCK.format_map(session))
+            parts.extend(f"- {technique}\n" for technique in session["techniques"])
+            parts.append("\n**Preparation:**\n\n")
+            parts.extend(f"- {step}\n" for step in session["preparation"])
+            parts.append("\n")
         
-        markdown += "## Resources\n\n"
+        parts.append("## Resources\n\n")
         for area_resources in coaching_plan["resources"]:
-            markdown += f"### {area_resources['focus_area']}\n\n"
-            
-            for resource in area_resources["resources"]:
-                markdown += f"#### {resource['title']} ({resource['type']})\n\n"
-                markdown += f"{resource['description']}\n\n"
+            parts.append(f"### {area_resources['focus_area']}\n\n")
+            parts.extend(_RESOURCE_BLOCK.format_map(resource) for resource in area_resources["resources"])
         
-        markdown += "## Success Metrics\n\n"
+        parts.append("## Success Metrics\n\n")
         for area_metrics in coaching_plan["success_metrics"]:
-            markdown += f"### {area_metrics['focus_area']}\n\n"
-            
-            for metric in area_metrics["metrics"]:
-                markdown += f"- {metric}\n"
-            markdown += "\n"
+            parts.append(f"### {area_metrics['focus_area']}\n\n")
+            parts.extend(f"- {metric}\n" for metric in area_metrics["metrics"])
+            parts.append("\n")
         
-        return markdown
+        return "".join(parts)
     
-    def _generate_summary_markdown(self, coaching_plans):
+    def _generate_summary_markdown(self, coaching_plans, run_date):
         """Generate a summary markdown report of all coaching plans"""
-        markdown = "# Coaching Plans Summary\n\n"
-        
-        markdown += f"**Date:** {datetime.now().strftime('%Y-%m-%d')}\n\n"
-        markdown += f"**Number of Team Members:** {len(coaching_plans)}\n\n"
+        parts = [
+            "# Coaching Plans Summary\n\n"
+            f"**Date:** {run_date}\n\n"
+            f"**Number of Team Members:** {len(coaching_plans)}\n\n"
+        ]
         
-        # Calculate totals
-        total_focus_areas = sum(len(plan["focus_areas"]) for plan in coaching_plans)
+        # Calculate totals and count focus area types
+        all_focus_areas = list(chain.from_iterable(plan["focus_areas"] for plan in coaching_plans))
+        total_focus_areas = len(all_focus_areas)
         total_sessions = sum(len(plan["coaching_sessions"]) for plan in coaching_plans)
+        focus_area_types = Counter(area["type"] for area in all_focus_areas)
         
-        # Count focus area types
-        focus_area_types = {}
-        for plan in coaching_plans:
-            for area in plan["focus_areas"]:
-                area_type = area["type"]
-                focus_area_types[area_type] = focus_area_types.get(area_type, 0) + 1
-        
-        markdown += "## Coaching Overview\n\n"
-        markdown += f"- **Total Focus Areas:** {total_focus_areas}\n"
-        markdown += f"- **Total Coaching Sessions:** {total_sessions}\n\n"
+        parts.append(
+            "## Coaching Overview\n\n"
+            f"- **Total Focus Areas:** {total_focus_areas}\n"
+            f"- **Total Coaching Sessions:** {total_sessions}\n\n"
+        )
         
-        markdown += "## Focus Area Types\n\n"
+        parts.append("## Focus Area Types\n\n")
+        # No rows (and so no division) when there are no focus areas
         for area_type, count in focus_area_types.items():
-            markdown += f"- **{area_type}:** {count} ({int(count/total_focus_areas*100)}%)\n"
-        markdown += "\n"
+            pct = count * 100 // total_focus_areas
+            parts.append(f"- **{area_type}:** {count} ({pct}%)\n")
+        parts.append("\n")
         
         # Team member summaries
-        markdown += "## Team Member Summaries\n\n"
+        parts.append("## Team Member Summaries\n\n")
         for plan in coaching_plans:
             member_name = plan["member_name"]
             role = plan["role"]
+            num_sessions = len(plan["coaching_sessions"])
+            check_in_frequency = plan["check_in_frequency"]
+            focus_areas_str = ", ".join(area["title"] for area in plan["focus_areas"])
             
-            focus_areas = [area["title"] for area in plan["focus_areas"]]
-            focus_areas_str = ", ".join(focus_areas)
-            
-            markdown += f"### {member_name} ({role})\n\n"
-            markdown += f"- **Focus Areas:** {focus_areas_str}\n"
-            markdown += f"- **Number of Sessions:** {len(plan['coaching_sessions'])}\n"
-            markdown += f"- **Check-in Frequency:** {plan['check_in_frequency']}\n\n"
+            parts.append(
+                f"### {member_name} ({role})\n\n"
+                f"- **Focus Areas:** {focus_areas_str}\n"
+                f"- **Number of Sessions:** {num_sessions}\n"
+                f"- **Check-in Frequency:** {check_in_frequency}\n\n"
+            )
         
-        return markdown
+        return "".join(parts)
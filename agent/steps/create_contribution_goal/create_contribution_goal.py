@@ -1,8 +1,287 @@
-import os
-import json
+import re
+from collections import Counter
+from functools import cached_property, lru_cache, partial
+from pathlib import Path
+from types import MappingProxyType
 from agent.step_base import StepBase
 from loguru import logger
 
+# Role-specific quarterly goal
+_ROLE_QUARTERLY_GOALS = MappingProxyType({
+    "Software Engineer": MappingProxyType({
+        "title": "Code Quality Improvement",
+        "description": "Improve code quality metrics across assigned projects",
+        "target": "Achieve code quality score of 85% or higher on all new code"
+    }),
+    "UX Designer": MappingProxyType({
+        "title": "User Experience Enhancement",
+        "description": "Enhance user experience for key product features",
+        "target": "Improve user satisfaction ratings by 15% for redesigned features"
+    }),
+    "Product Manager": MappingProxyType({
+        "title": "Feature Delivery Optimization",
+        "description": "Optimize feature delivery process to improve time-to-market",
+        "target": "Reduce average feature delivery time by 20%"
+    }),
+    "Data Scientist": MappingProxyType({
+        "title": "Data Model Improvement",
+        "description": "Improve accuracy and performance of data models",
+        "target": "Increase model accuracy by 10% while maintaining or improving inference speed"
+    }),
+    "DevOps Engineer": MappingProxyType({
+        "title": "Infrastructure Reliability",
+        "description": "Enhance infrastructure reliability and performance",
+        "target": "Reduce system downtime by 25% and improve response time by 15%"
+    })
+})
+
+_DEFAULT_ROLE_QUARTERLY_GOAL = MappingProxyType({
+    "title": "Professional Growth",
+    "description": "Focus on professional growth and skill development",
+    "target": "Acquire at least two new relevant skills or certifications"
+})
+
+# Quarterly goal building on the member's top strength
+_STRENGTH_GOALS = MappingProxyType({
+    "code_quality": MappingProxyType({
+        "title": "Code Quality Leadership",
+        "description": "Lead initiatives to improve team-wide code quality",
+        "target": "Implement at least 3 team-wide code quality improvements"
+    }),
+    "productivity": MappingProxyType({
+        "title": "Productivity Optimization",
+        "description": "Optimize workflows and processes to improve team productivity",
+        "target": "Implement at least 2 workflow improvements that save 5+ hours per week"
+    }),
+    "collaboration": MappingProxyType({
+        "title": "Cross-team Collaboration",
+        "description": "Strengthen cross-team collaboration on key projects",
+        "target": "Successfully lead at least 2 cross-team initiatives"
+    }),
+    "innovation": MappingProxyType({
+        "title": "Innovation Leadership",
+        "description": "Lead innovation initiatives to solve key challenges",
+        "target": "Propose and implement at least 2 innovative solutions to existing problems"
+    }),
+    "reliability": MappingProxyType({
+        "title": "Reliability Improvement",
+        "description": "Improve system or process reliability",
+        "target": "Reduce failure rate by 30% in assigned areas of responsibility"
+    }),
+    "customer_focus": MappingProxyType({
+        "title": "Customer Satisfaction",
+        "description": "Drive improvements in customer satisfaction",
+        "target": "Increase customer satisfaction score by 15% for key features"
+    })
+})
+
+# Quarterly goal addressing the member's top improvement area
+_IMPROVEMENT_GOALS = MappingProxyType({
+    "code_quality": MappingProxyType({
+        "title": "Code Quality Improvement",
+        "description": "Improve personal code quality metrics",
+        "target": "Reduce code review feedback by 50% through improved initial submissions"
+    }),
+    "productivity": MappingProxyType({
+        "title": "Productivity Enhancement",
+        "description": "Enhance personal productivity through improved practices",
+        "target": "Increase task completion rate by 25%"
+    }),
+    "collaboration": MappingProxyType({
+        "title": "Team Collaboration",
+        "description": "Strengthen collaboration with team members",
+        "target": "Actively participate in at least 3 collaborative projects"
+    }),
+    "innovation": MappingProxyType({
+        "title": "Innovation Development",
+        "description": "Develop innovation skills through structured exploration",
+        "target": "Submit at least 3 innovative ideas and implement at least 1"
+    }),
+    "reliability": MappingProxyType({
+        "title": "Work Reliability",
+        "description": "Improve reliability of work and commitments",
+        "target": "Meet 95% of commitments on time"
+    }),
+    "customer_focus": MappingProxyType({
+        "title": "Customer Understanding",
+        "description": "Deepen understanding of customer needs",
+        "target": "Participate in at least 5 customer interviews or feedback sessions"
+    })
+})
+
+# Project key result templates by keyword, in priority order ({project} is filled in)
+_PROJECT_KEY_RESULTS = MappingProxyType({
+    "Portal": MappingProxyType({
+        "title": "{project} Enhancement",
+        "description": "Successfully deliver enhancements to improve user experience",
+        "measure": "Positive user feedback and 10% increase in engagement metrics"
+    }),
+    "API": MappingProxyType({
+        "title": "{project} Optimization",
+        "description": "Optimize API performance and reliability",
+        "measure": "30% reduction in API response time and 99.9% uptime"
+    }),
+    "App": MappingProxyType({
+        "title": "{project} Development",
+        "description": "Successful development and deployment",
+        "measure": "On-time delivery with fewer than 5 critical bugs"
+    }),
+    "Data": MappingProxyType({
+        "title": "{project} Implementation",
+        "description": "Successfully implement data pipeline improvements",
+        "measure": "50% improvement in data processing time and 99% accuracy"
+    }),
+    "Cloud": MappingProxyType({
+        "title": "{project} Completion",
+        "description": "Complete cloud migration with minimal disruption",
+        "measure": "Zero downtime during migration and 20% cost reduction"
+    })
+})
+
+# Finds every project keyword in one scan. No keyword can overlap another, so
+# findall sees all of them and the highest-priority one can be picked
+_PROJECT_KW_RE = re.compile("|".join(re.escape(keyword) for keyword in _PROJECT_KEY_RESULTS))
+
+_PROJECT_KEYWORD_PRIORITY = MappingProxyType({keyword: i for i, keyword in enumerate(_PROJECT_KEY_RESULTS)})
+
+_DEFAULT_PROJECT_KEY_RESULT = MappingProxyType({
+    "title": "{project} Delivery",
+    "description": "Successfully deliver project milestones",
+    "measure": "On-time delivery of all key milestones"
+})
+
+# Role-specific key result
+_ROLE_KEY_RESULTS = MappingProxyType({
+    "Software Engineer": MappingProxyType({
+        "title": "Code Quality",
+        "description": "Maintain high code quality standards",
+        "measure": "90% code coverage and fewer than 3 bugs per release"
+    }),
+    "UX Designer": MappingProxyType({
+        "title": "Design System",
+        "description": "Contribute to the design system",
+        "measure": "Add at least 5 new components to the design system"
+    }),
+    "Product Manager": MappingProxyType({
+        "title": "Feature Adoption",
+        "description": "Drive adoption of new features",
+        "measure": "Achieve 40% adoption rate for new features within first month"
+    }),
+    "Data Scientist": MappingProxyType({
+        "title": "Model Accuracy",
+        "description": "Improve model accuracy",
+        "measure": "Increase model accuracy by 15% over current baseline"
+    }),
+    "DevOps Engineer": MappingProxyType({
+        "title": "Deployment Frequency",
+        "description": "Increase deployment frequency",
+        "measure": "Enable daily deployments with 99% success rate"
+    })
+})
+
+# Key result every member gets
+_GENERIC_KEY_RESULT = MappingProxyType({
+    "title": "Professional Development",
+    "description": "Continuous learning and skill development",
+    "measure": "Complete at least 2 relevant courses or certifications"
+})
+
+# Development focus for each improvement area
+_IMPROVEMENT_DEV_FOCUS = MappingProxyType({
+    "code_quality": MappingProxyType({
+        "area": "Technical Excellence",
+        "description": "Focus on improving code quality, testing, and best practices",
+        "success_criteria": "Consistently high code review ratings with minimal rework"
+    }),
+    "productivity": MappingProxyType({
+        "area": "Efficiency",
+        "description": "Improve work efficiency and output",
+        "success_criteria": "Consistent delivery of high-quality work on schedule"
+    }),
+    "collaboration": MappingProxyType({
+        "area": "Teamwork",
+        "description": "Enhance collaboration and communication with team members",
+        "success_criteria": "Positive feedback from team members on collaboration"
+    }),
+    "innovation": MappingProxyType({
+        "area": "Creative Problem-Solving",
+        "description": "Develop creative approaches to solving challenges",
+        "success_criteria": "Implementation of at least 2 innovative solutions"
+    }),
+    "reliability": MappingProxyType({
+        "area": "Dependability",
+        "description": "Improve reliability and consistency of work",
+        "success_criteria": "Meeting 95% of commitments on time with high quality"
+    }),
+    "customer_focus": MappingProxyType({
+        "area": "Customer Orientation",
+        "description": "Strengthen understanding of and focus on customer needs",
+        "success_criteria": "Customer feedback incorporated into all deliverables"
+    })
+})
+
+# Role-specific career development focus
+_ROLE_DEV_FOCUS = MappingProxyType({
+    "Software Engineer": MappingProxyType({
+        "area": "Technical Leadership",
+        "description": "Develop technical leadership skills",
+        "success_criteria": "Successfully lead at least one technical initiative"
+    }),
+    "UX Designer": MappingProxyType({
+        "area": "Design Innovation",
+        "description": "Explore innovative design approaches",
+        "success_criteria": "Implementation of at least one innovative design concept"
+    }),
+    "Product Manager": MappingProxyType({
+        "area": "Strategic Thinking",
+        "description": "Develop strategic product thinking",
+        "success_criteria": "Create a compelling long-term vision for assigned product area"
+    }),
+    "Data Scientist": MappingProxyType({
+        "area": "Advanced Analytics",
+        "description": "Expand knowledge of advanced analytics techniques",
+        "success_criteria": "Successfully apply at least one new advanced technique"
+    }),
+    "DevOps Engineer": MappingProxyType({
+        "area": "Infrastructure Innovation",
+        "description": "Explore innovative infrastructure solutions",
+        "success_criteria": "Implement at least one infrastructure improvement"
+    })
+})
+
+_DEFAULT_ROLE_DEV_FOCUS = MappingProxyType({
+    "area": "Professional Growth",
+    "description": "Focus on professional development in key skill areas",
+    "success_criteria": "Acquisition of at least two new relevant skills"
+})
+
+# Row of the team members table in the summary
+_SUMMARY_ROW = "| {name} | {role} | {goals} |\n"
+
+def _goal_row(i, goal):
+    """Markdown pieces for one quarterly goal, joined by the caller"""
+    return (
+        "### Goal ", str(i), ": ", goal["title"], "\n\n",
+        "**Description:** ", goal["description"], "\n\n",
+        "**Target:** ", goal["target"], "\n\n"
+    )
+
+def _key_result_row(i, result):
+    """Markdown pieces for one key result, joined by the caller"""
+    return (
+        "### KR ", str(i), ": ", result["title"], "\n\n",
+        "**Description:** ", result["description"], "\n\n",
+        "**Measure:** ", result["measure"], "\n\n"
+    )
+
+def _focus_row(i, focus):
+    """Markdown pieces for one development focus, joined by the caller"""
+    return (
+        "### Focus ", str(i), ": ", focus["area"], "\n\n",
+        "**Description:** ", focus["description"], "\n\n",
+        "**Success Criteria:** ", focus["success_criteria"], "\n\n"
+    )
+
 class CreateContributionGoalStep(StepBase):
     """
     Implementation of the Create Contribution Goal step.
@@ -20,34 +299,29 @@ class CreateContributionGoalStep(StepBase):
         logger.info("Executing Create Contribution Goal step")
         
         # Read evaluations from previous step
-        evaluations_path = os.path.join(
-            os.path.dirname(os.path.dirname(self.input_dir)),
-            "evaluation_generation",
-            "out",
-            "evaluations.json"
-        )
+        evaluations_path = self._evaluations_path
         
-        if not os.path.exists(evaluations_path):
+        if not evaluations_path.is_file():
             logger.error("Evaluations not found. Please run evaluation_generation step first.")
             return False
         
-        # Load evaluations
-        with open(evaluations_path, "r", encoding="utf-8") as f:
-            evaluations = json.load(f)
+        # Load evaluations (shared with other steps reading the same file)
+        evaluations = self.read_json_cached(evaluations_path)
         
         # Generate contribution goals
         contribution_goals = self._generate_contribution_goals(evaluations)
         
         # Write contribution goals to output
-        self.write_output_file("contribution_goals.json", json.dumps(contribution_goals, indent=2))
-        
-        # Also write a markdown summary for each team member
-        for member_goals in contribution_goals:
-            member_name = member_goals["member_name"].replace(" ", "_").lower()
-            self.write_output_file(
-                f"{member_name}_goals.md",
-                self._generate_goals_markdown(member_goals)
-            )
+        self.write_output_json("contribution_goals.json", contribution_goals)
+        
+        # Also write a markdown summary for each team member; the files are
+        # independent, so overlap their writes
+        if not self.write_outputs_concurrently([
+            (f"{self.member_slug(member_goals['member_name'])}_goals.md",
+             partial(self._write_member_goals, member_goals))
+            for member_goals in contribution_goals
+        ]):
+            return False
         
         # Write a summary markdown file
         self.write_output_file(
@@ -57,385 +331,166 @@ class CreateContributionGoalStep(StepBase):
         
         return True
     
+    def _write_member_goals(self, member_goals: dict, filename: str) -> None:
+        """
+        Write the markdown contribution goals for one team member.
+        
+        Args:
+            member_goals: The member's contribution goals.
+            filename: The name of the output file.
+        """
+        self.write_output_file_iter(filename, self._iter_goals_markdown(member_goals))
+    
+    @cached_property
+    def _evaluations_path(self) -> Path:
+        """Path to the evaluations written by the evaluation_generation step (resolved once per instance)"""
+        return Path(self.input_dir).parent.parent / "evaluation_generation" / "out" / "evaluations.json"
+    
     def _generate_contribution_goals(self, evaluations):
         """Generate contribution goals for each team member"""
-        contribution_goals = []
-        
-        for evaluation in evaluations:
-            member_id = evaluation["member_id"]
-            member_name = evaluation["member_name"]
-            role = evaluation["role"]
-            
-            # Generate the contribution goals
-            goals = {
-                "member_id": member_id,
-                "member_name": member_name,
-                "role": role,
+        return [
+            {
+                "member_id": evaluation["member_id"],
+                "member_name": evaluation["member_name"],
+                "role": evaluation["role"],
                 "quarterly_goals": self._generate_quarterly_goals(evaluation),
                 "key_results": self._generate_key_results(evaluation),
                 "development_focus": self._get_development_focus(evaluation)
             }
-            
-            contribution_goals.append(goals)
-        
-        return contribution_goals
+            for evaluation in evaluations
+        ]
     
     def _generate_quarterly_goals(self, evaluation):
         """Generate quarterly goals based on the evaluation"""
-        quarterly_goals = []
-        role = evaluation["role"]
         strengths = evaluation["strengths"]
         improvement_areas = evaluation["improvement_areas"]
+        top_strength = strengths[0] if strengths else None
+        top_improvement = improvement_areas[0] if improvement_areas else None
         
+        return list(self._quarterly_goals_for(evaluation["role"], top_strength, top_improvement))
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _quarterly_goals_for(role, top_strength, top_improvement):
+        """Build the quarterly goals for a role, top strength and top improvement area (cached)"""
         # Goal 1: Role-specific goal
-        if role == "Software Engineer":
-            quarterly_goals.append({
-                "title": "Code Quality Improvement",
-                "description": "Improve code quality metrics across assigned projects",
-                "target": "Achieve code quality score of 85% or higher on all new code"
-            })
-        elif role == "UX Designer":
-            quarterly_goals.append({
-                "title": "User Experience Enhancement",
-                "description": "Enhance user experience for key product features",
-                "target": "Improve user satisfaction ratings by 15% for redesigned features"
-            })
-        elif role == "Product Manager":
-            quarterly_goals.append({
-                "title": "Feature Delivery Optimization",
-                "description": "Optimize feature delivery process to improve time-to-market",
-                "target": "Reduce average feature delivery time by 20%"
-            })
-        elif role == "Data Scientist":
-            quarterly_goals.append({
-                "title": "Data Model Improvement",
-                "description": "Improve accuracy and performance of data models",
-                "target": "Increase model accuracy by 10% while maintaining or improving inference speed"
-            })
-        elif role == "DevOps Engineer":
-            quarterly_goals.append({
-                "title": "Infrastructure Reliability",
-                "description": "Enhance infrastructure reliability and performance",
-                "target": "Reduce system downtime by 25% and improve response time by 15%"
-            })
-        else:
-            quarterly_goals.append({
-                "title": "Professional Growth",
-                "description": "Focus on professional growth and skill development",
-                "target": "Acquire at least two new relevant skills or certifications"
-            })
+        quarterly_goals = [_ROLE_QUARTERLY_GOALS.get(role, _DEFAULT_ROLE_QUARTERLY_GOAL)]
         
-        # Goal 2: Strength-based goal
-        if strengths:
-            top_strength = strengths[0]
-            if top_strength == "code_quality":
-                quarterly_goals.append({
-                    "title": "Code Quality Leadership",
-                    "description": "Lead initiatives to improve team-wide code quality",
-                    "target": "Implement at least 3 team-wide code quality improvements"
-                })
-            elif top_strength == "productivity":
-                quarterly_goals.append({
-                    "title": "Productivity Optimization",
-                    "description": "Optimize workflows and processes to improve team productivity",
-                    "target": "Implement at least 2 workflow improvements that save 5+ hours per week"
-                })
-            elif top_strength == "collaboration":
-                quarterly_goals.append({
-                    "title": "Cross-team Collaboration",
-                    "description": "Strengthen cross-team collaboration on key projects",
-                    "target": "Successfully lead at least 2 cross-team initiatives"
-                })
-            elif top_strength == "innovation":
-                quarterly_goals.append({
-                    "title": "Innovation Leadership",
-                    "description": "Lead innovation initiatives to solve key challenges",
-                    "target": "Propose and implement at least 2 innovative solutions to existing problems"
-                })
-            elif top_strength == "reliability":
-                quarterly_goals.append({
-                    "title": "Reliability Improvement",
-                    "description": "Improve system or process reliability",
-                    "target": "Reduce failure rate by 30% in assigned areas of responsibility"
-                })
-            elif top_strength == "customer_focus":
-                quarterly_goals.append({
-                    "title": "Customer Satisfaction",
-                    "description": "Drive improvements in customer satisfaction",
-                    "target": "Increase customer satisfaction score by 15% for key features"
-                })
+        # Goal 2: Strength-based goal (skipped for metrics without one)
+        if top_strength is not None:
+            strength_goal = _STRENGTH_GOALS.get(top_strength)
+            if strength_goal is not None:
+                quarterly_goals.append(strength_goal)
         
         # Goal 3: Improvement-focused goal
-        if improvement_areas:
-            top_improvement = improvement_areas[0]
-            if top_improvement == "code_quality":
-                quarterly_goals.append({
-                    "title": "Code Quality Improvement",
-                    "description": "Improve personal code quality metrics",
-                    "target": "Reduce code review feedback by 50% through improved initial submissions"
-                })
-            elif top_improvement == "productivity":
-                quarterly_goals.append({
-                    "title": "Productivity Enhancement",
-                    "description": "Enhance personal productivity through improved practices",
-                    "target": "Increase task completion rate by 25%"
-                })
-            elif top_improvement == "collaboration":
-                quarterly_goals.append({
-                    "title": "Team Collaboration",
-                    "description": "Strengthen collaboration with team members",
-                    "target": "Actively participate in at least 3 collaborative projects"
-                })
-            elif top_improvement == "innovation":
-                quarterly_goals.append({
-                    "title": "Innovation Development",
-                    "description": "Develop innovation skills through structured exploration",
-                    "target": "Submit at least 3 innovative ideas and implement at least 1"
-                })
-            elif top_improvement == "reliability":
-                quarterly_goals.append({
-                    "title": "Work Reliability",
-                    "description": "Improve reliability of work and commitments",
-                    "target": "Meet 95% of commitments on time"
-                })
-            elif top_improvement == "customer_focus":
-                quarterly_goals.append({
-                    "title": "Customer Understanding",
-                    "description": "Deepen understanding of customer needs",
-                    "target": "Participate in at least 5 customer interviews or feedback sessions"
-                })
+        if top_improvement is not None:
+            improvement_goal = _IMPROVEMENT_GOALS.get(top_improvement)
+            if improvement_goal is not None:
+                quarterly_goals.append(improvement_goal)
         
-        return quarterly_goals
+        return tuple(quarterly_goals)
     
     def _generate_key_results(self, evaluation):
         """Generate key results based on the evaluation"""
+        return list(self._key_results_for(evaluation["role"], tuple(evaluation["projects"])))
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _key_results_for(role, projects):
+        """Build the key results for a role and its projects (cached)"""
         key_results = []
         
-        # Project-specific key results
-        for project in evaluation["projects"]:
-            if "Portal" in project:
-                key_results.append({
-                    "title": f"{project} Enhancement",
-                    "description": "Successfully deliver enhancements to improve user experience",
-                    "measure": "Positive user feedback and 10% increase in engagement metrics"
-                })
-            elif "API" in project:
-                key_results.append({
-                    "title": f"{project} Optimization",
-                    "description": "Optimize API performance and reliability",
-                    "measure": "30% reduction in API response time and 99.9% uptime"
-                })
-            elif "App" in project:
-                key_results.append({
-                    "title": f"{project} Development",
-                    "description": "Successful development and deployment",
-                    "measure": "On-time delivery with fewer than 5 critical bugs"
-                })
-            elif "Data" in project:
-                key_results.append({
-                    "title": f"{project} Implementation",
-                    "description": "Successfully implement data pipeline improvements",
-                    "measure": "50% improvement in data processing time and 99% accuracy"
-                })
-            elif "Cloud" in project:
-                key_results.append({
-                    "title": f"{project} Completion",
-                    "description": "Complete cloud migration with minimal disruption",
-                    "measure": "Zero downtime during migration and 20% cost reduction"
-                })
+        # Project-specific key results, from the highest-priority keyword in the project name
+        for project in projects:
+            keywords = _PROJECT_KW_RE.findall(project)
+            if keywords:
+                template = _PROJECT_KEY_RESULTS[min(keywords, key=_PROJECT_KEYWORD_PRIORITY.__getitem__)]
             else:
-                key_results.append({
-                    "title": f"{project} Delivery",
-                    "description": "Successfully deliver project milestones",
-                    "measure": "On-time delivery of all key milestones"
-                })
-        
-        # Role-specific key results
-        role = evaluation["role"]
-        if role == "Software Engineer":
-            key_results.append({
-                "title": "Code Quality",
-                "description": "Maintain high code quality standards",
-                "measure": "90% code coverage and fewer than 3 bugs per release"
-            })
-        elif role == "UX Designer":
-            key_results.append({
-                "title": "Design System",
-                "description": "Contribute to the design system",
-                "measure": "Add at least 5 new components to the design system"
-            })
-        elif role == "Product Manager":
-            key_results.append({
-                "title": "Feature Adoption",
-                "description": "Drive adoption of new features",
-                "measure": "Achieve 40% adoption rate for new features within first month"
-            })
-        elif role == "Data Scientist":
-            key_results.append({
-                "title": "Model Accuracy",
-                "description": "Improve model accuracy",
-                "measure": "Increase model accuracy by 15% over current baseline"
-            })
-        elif role == "DevOps Engineer":
+                template = _DEFAULT_PROJECT_KEY_RESULT
             key_results.append({
-                "title": "Deployment Frequency",
-                "description": "Increase deployment frequency",
-                "measure": "Enable daily deployments with 99% success rate"
+                "title": template["title"].format(project=project),
+                "description": template["description"],
+                "measure": template["measure"]
             })
         
+        # Role-specific key results
+        role_key_result = _ROLE_KEY_RESULTS.get(role)
+        if role_key_result:
+            key_results.append(role_key_result)
+        
         # Add one more generic result
-        key_results.append({
-            "title": "Professional Development",
-            "description": "Continuous learning and skill development",
-            "measure": "Complete at least 2 relevant courses or certifications"
-        })
+        key_results.append(_GENERIC_KEY_RESULT)
         
-        return key_results
+        return tuple(key_results)
     
     def _get_development_focus(self, evaluation):
         """Determine development focus areas based on evaluation"""
-        development_focus = []
-        
+        return list(self._development_focus_for(evaluation["role"], tuple(evaluation["improvement_areas"])))
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _development_focus_for(role, improvement_areas):
+        """Build the development focus areas for a role and its improvement areas (cached)"""
         # Add focus areas based on improvement areas
-        for area in evaluation["improvement_areas"]:
-            if area == "code_quality":
-                development_focus.append({
-                    "area": "Technical Excellence",
-                    "description": "Focus on improving code quality, testing, and best practices",
-                    "success_criteria": "Consistently high code review ratings with minimal rework"
-                })
-            elif area == "productivity":
-                development_focus.append({
-                    "area": "Efficiency",
-                    "description": "Improve work efficiency and output",
-                    "success_criteria": "Consistent delivery of high-quality work on schedule"
-                })
-            elif area == "collaboration":
-                development_focus.append({
-                    "area": "Teamwork",
-                    "description": "Enhance collaboration and communication with team members",
-                    "success_criteria": "Positive feedback from team members on collaboration"
-                })
-            elif area == "innovation":
-                development_focus.append({
-                    "area": "Creative Problem-Solving",
-                    "description": "Develop creative approaches to solving challenges",
-                    "success_criteria": "Implementation of at least 2 innovative solutions"
-                })
-            elif area == "reliability":
-                development_focus.append({
-                    "area": "Dependability",
-                    "description": "Improve reliability and consistency of work",
-                    "success_criteria": "Meeting 95% of commitments on time with high quality"
-                })
-            elif area == "customer_focus":
-                development_focus.append({
-                    "area": "Customer Orientation",
-                    "description": "Strengthen understanding of and focus on customer needs",
-                    "success_criteria": "Customer feedback incorporated into all deliverables"
-                })
+        development_focus = [
+            _IMPROVEMENT_DEV_FOCUS[area]
+            for area in improvement_areas
+            if area in _IMPROVEMENT_DEV_FOCUS
+        ]
         
         # Add one career development focus
-        role = evaluation["role"]
-        if role == "Software Engineer":
-            development_focus.append({
-                "area": "Technical Leadership",
-                "description": "Develop technical leadership skills",
-                "success_criteria": "Successfully lead at least one technical initiative"
-            })
-        elif role == "UX Designer":
-            development_focus.append({
-                "area": "Design Innovation",
-                "description": "Explore innovative design approaches",
-                "success_criteria": "Implementation of at least one innovative design concept"
-            })
-        elif role == "Product Manager":
-            development_focus.append({
-                "area": "Strategic Thinking",
-                "description": "Develop strategic product thinking",
-                "success_criteria": "Create a compelling long-term vision for assigned product area"
-            })
-        elif role == "Data Scientist":
-            development_focus.append({
-                "area": "Advanced Analytics",
-                "description": "Expand knowledge of advanced analytics techniques",
-                "success_criteria": "Successfully apply at least one new advanced technique"
-            })
-        elif role == "DevOps Engineer":
-            development_focus.append({
-                "area": "Infrastructure Innovation",
-                "description": "Explore innovative infrastructure solutions",
-                "success_criteria": "Implement at least one infrastructure improvement"
-            })
-        else:
-            development_focus.append({
-                "area": "Professional Growth",
-                "description": "Focus on professional development in key skill areas",
-                "success_criteria": "Acquisition of at least two new relevant skills"
-            })
+        development_focus.append(_ROLE_DEV_FOCUS.get(role, _DEFAULT_ROLE_DEV_FOCUS))
         
-        return development_focus
+        return tuple(development_focus)
     
-    def _generate_goals_markdown(self, goals):
-        """Generate a markdown summary of contribution goals for a team member"""
-        markdown = f"# Contribution Goals: {goals['member_name']}\n\n"
-        markdown += f"**Role:** {goals['role']}\n\n"
+    def _iter_goals_markdown(self, goals):
+        """Yield the markdown summary of contribution goals for a team member in fragments"""
+        yield (
+            f"# Contribution Goals: {goals['member_name']}\n\n"
+            f"**Role:** {goals['role']}\n\n"
+        )
         
-        markdown += "## Quarterly Goals\n\n"
+        yield "## Quarterly Goals\n\n"
         for i, goal in enumerate(goals["quarterly_goals"], 1):
-            markdown += f"### Goal {i}: {goal['title']}\n\n"
-            markdown += f"**Description:** {goal['description']}\n\n"
-            markdown += f"**Target:** {goal['target']}\n\n"
+            yield "".join(_goal_row(i, goal))
         
-        markdown += "## Key Results\n\n"
+        yield "## Key Results\n\n"
         for i, result in enumerate(goals["key_results"], 1):
-            markdown += f"### KR {i}: {result['title']}\n\n"
-            markdown += f"**Description:** {result['description']}\n\n"
-            markdown += f"**Measure:** {result['measure']}\n\n"
+            yield "".join(_key_result_row(i, result))
         
-        markdown += "## Development Focus\n\n"
+        yield "## Development Focus\n\n"
         for i, focus in enumerate(goals["development_focus"], 1):
-            markdown += f"### Focus {i}: {focus['area']}\n\n"
-            markdown += f"**Description:** {focus['description']}\n\n"
-            markdown += f"**Success Criteria:** {focus['success_criteria']}\n\n"
-        
-        return markdown
+            yield "".join(_focus_row(i, focus))
     
     def _generate_summary_markdown(self, all_goals):
         """Generate a summary markdown for all contribution goals"""
-        markdown = "# Team Contribution Goals Summary\n\n"
-        
-        markdown += "## Overview\n\n"
-        markdown += f"This document summarizes the contribution goals for {len(all_goals)} team members.\n\n"
-        
-        markdown += "## Team Members and Goals\n\n"
-        markdown += "| Team Member | Role | Primary Goals |\n"
-        markdown += "|------------|------|---------------|\n"
-        
-        for member_goals in all_goals:
-            name = member_goals["member_name"]
-            role = member_goals["role"]
-            
-            primary_goals = ", ".join([goal["title"] for goal in member_goals["quarterly_goals"]])
-            
-            markdown += f"| {name} | {role} | {primary_goals} |\n"
-        
-        markdown += "\n## Key Development Focus Areas\n\n"
+        parts = [
+            "# Team Contribution Goals Summary\n\n"
+            "## Overview\n\n"
+            f"This document summarizes the contribution goals for {len(all_goals)} team members.\n\n"
+            "## Team Members and Goals\n\n"
+            "| Team Member | Role | Primary Goals |\n"
+            "|------------|------|---------------|\n"
+        ]
+        
+        parts.extend(
+            _SUMMARY_ROW.format(
+                name=member_goals["member_name"],
+                role=member_goals["role"],
+                goals=", ".join([goal["title"] for goal in member_goals["quarterly_goals"]])
+            )
+            for member_goals in all_goals
+        )
         
-        # Collect all development focus areas
-        focus_areas = {}
-        for member_goals in all_goals:
-            for focus in member_goals["development_focus"]:
-                area = focus["area"]
-                if area in focus_areas:
-                    focus_areas[area] += 1
-                else:
-                    focus_areas[area] = 1
+        parts.append("\n## Key Development Focus Areas\n\n")
         
-        # Sort by frequency
-        sorted_areas = sorted(focus_areas.items(), key=lambda x: x[1], reverse=True)
+        # Count all development focus areas, listed by frequency
+        focus_areas = Counter(
+            focus["area"]
+            for member_goals in all_goals
+            for focus in member_goals["development_focus"]
+        )
         
-        for area, count in sorted_areas:
-            markdown += f"- **{area}**: {count} team members\n"
+        parts.extend(f"- **{area}**: {count} team members\n" for area, count in focus_areas.most_common())
         
-        return markdown
+        return "".join(parts)
@@ -1,9 +1,32 @@
 import os
 import json
 import random
+from itertools import compress
+from types import MappingProxyType
+from agent.metrics import METRICS, display_metric
 from agent.step_base import StepBase
 from loguru import logger
 
+_QUARTERS = ("Q1", "Q2", "Q3")
+
+# Team and projects used to generate sample data when none is provided
+_SAMPLE_TEAM_MEMBERS = (
+    MappingProxyType({"id": 1, "name": "John Smith", "role": "Software Engineer"}),
+    MappingProxyType({"id": 2, "name": "Emily Johnson", "role": "UX Designer"}),
+    MappingProxyType({"id": 3, "name": "Michael Brown", "role": "Product Manager"}),
+    MappingProxyType({"id": 4, "name": "Sarah Davis", "role": "Data Scientist"}),
+    MappingProxyType({"id": 5, "name": "David Wilson", "role": "DevOps Engineer"})
+)
+
+_SAMPLE_PROJECTS = (
+    "Customer Portal Redesign",
+    "API Performance Optimization",
+    "Mobile App Launch",
+    "Data Pipeline Modernization",
+    "Cloud Migration"
+)
+
+
 class DataAnalysisStep(StepBase):
     """
     Implementation of the Data Analysis step.
@@ -20,120 +43,78 @@ class DataAnalysisStep(StepBase):
         """
         logger.info("Executing Data Analysis step")
         
-        # Create sample data if it doesn't exist
+        # Create sample data if it doesn't exist; otherwise load the team data
         if not self.list_input_files():
-            self._create_sample_data()
+            team_data = self._create_sample_data()
+        else:
+            team_data = self._load_team_data()
         
         # Analyze the data
-        team_data = self._load_team_data()
         analysis_results = self._analyze_data(team_data)
         
         # Write the analysis results
-        self.write_output_file("analysis_results.json", json.dumps(analysis_results, indent=2))
+        self.write_output_json("analysis_results.json", analysis_results)
         self.write_output_file("analysis_summary.md", self._generate_summary(analysis_results))
         
         return True
     
-    def _create_sample_data(self) -> None:
-        """Create sample data for demonstration purposes"""
-        team_members = [
-            {"id": 1, "name": "John Smith", "role": "Software Engineer"},
-            {"id": 2, "name": "Emily Johnson", "role": "UX Designer"},
-            {"id": 3, "name": "Michael Brown", "role": "Product Manager"},
-            {"id": 4, "name": "Sarah Davis", "role": "Data Scientist"},
-            {"id": 5, "name": "David Wilson", "role": "DevOps Engineer"}
-        ]
-        
-        metrics = [
-            "code_quality", "productivity", "collaboration", 
-            "innovation", "reliability", "customer_focus"
-        ]
+    def _create_sample_data(self) -> list:
+        """Create sample data for demonstration purposes, save it and return it"""
+        # Bind the generator once; draws happen in the same order as always, so a
+        # seeded run still produces the same sample data
+        uniform = random.uniform
         
         # Generate random performance data for each team member
         team_data = []
-        for member in team_members:
-            performance = {}
-            for metric in metrics:
-                # Generate scores for the last 3 quarters
-                performance[metric] = {
-                    "Q1": round(random.uniform(2.0, 5.0), 1),
-                    "Q2": round(random.uniform(2.0, 5.0), 1),
-                    "Q3": round(random.uniform(2.0, 5.0), 1)
-                }
+        for member in _SAMPLE_TEAM_MEMBERS:
+            # Generate scores for the last 3 quarters
+            performance = {
+                metric: {quarter: round(uniform(2.0, 5.0), 1) for quarter in _QUARTERS}
+                for metric in METRICS
+            }
             
             # Add some projects
-            projects = [
-                "Customer Portal Redesign",
-                "API Performance Optimization",
-                "Mobile App Launch",
-                "Data Pipeline Modernization",
-                "Cloud Migration"
-            ]
-            
-            member_projects = random.sample(projects, random.randint(1, 3))
+            member_projects = random.sample(_SAMPLE_PROJECTS, random.randint(1, 3))
             
             team_data.append({
-                "member": member,
+                "member": dict(member),
                 "performance": performance,
                 "projects": member_projects,
                 "feedback": []  # Will be filled in later steps
             })
         
         # Save the team data
-        self.write_output_file("team_data.json", json.dumps(team_data, indent=2))
+        self.write_output_json("team_data.json", team_data)
+        
+        return team_data
     
     def _load_team_data(self) -> list:
         """Load team data from the input directory or create sample data"""
-        team_data_path = self.get_input_path("team_data.json")
-        
-        if os.path.exists(team_data_path):
+        # Prefer team data provided as input, then sample data saved by an earlier run
+        for team_data_path, location in (
+            (self.get_input_path("team_data.json"), "input dir"),
+            (self.get_output_path("team_data.json"), "output dir")
+        ):
+            if not os.path.exists(team_data_path):
+                continue
             try:
                 with open(team_data_path, "r", encoding="utf-8") as f:
                     return json.load(f)
             except FileNotFoundError:
-                logger.error(f"Team data file not found at {team_data_path} (input dir)")
+                logger.error(f"Team data file not found at {team_data_path} ({location})")
             except json.JSONDecodeError:
-                logger.error(f"Error decoding JSON from {team_data_path} (input dir)")
+                logger.error(f"Error decoding JSON from {team_data_path} ({location})")
             except OSError as e:
-                logger.error(f"An OS error occurred while reading {team_data_path} (input dir): {e}")
+                logger.error(f"An OS error occurred while reading {team_data_path} ({location}): {e}")
 
-        # If no input data, check if we already created sample data in output
-        team_data_path = self.get_output_path("team_data.json")
-        
-        if os.path.exists(team_data_path):
-            try:
-                with open(team_data_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except FileNotFoundError:
-                logger.error(f"Team data file not found at {team_data_path} (output dir)")
-            except json.JSONDecodeError:
-                logger.error(f"Error decoding JSON from {team_data_path} (output dir)")
-            except OSError as e:
-                logger.error(f"An OS error occurred while reading {team_data_path} (output dir): {e}")
-
-        # If we get here, we need to create sample data
+        # If we get here, we need to create sample data; it is used as built
+        # rather than read back from the file just written
         logger.info("No existing team data found, creating sample data.")
-        self._create_sample_data()
-        
-        # Try to load the newly created sample data
-        team_data_path = self.get_output_path("team_data.json") # Ensure we are using output path for newly created sample
-        try:
-            with open(team_data_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.error(f"Failed to load newly created sample data from {team_data_path}")
-            return [] # Return empty list if sample creation/loading fails
-        except json.JSONDecodeError:
-            logger.error(f"Error decoding newly created sample data from {team_data_path}")
-            return [] # Return empty list if sample creation/loading fails
-        except OSError as e:
-            logger.error(f"An OS error occurred while reading newly created sample data from {team_data_path}: {e}")
-            return [] # Return empty list if sample creation/loading fails
+        return self._create_sample_data()
     
     def _analyze_data(self, team_data: list) -> dict:
         """Analyze the team performance data"""
-        metrics = ["code_quality", "productivity", "collaboration", 
-                  "innovation", "reliability", "customer_focus"]
+        metrics = METRICS
         
         results = {
             "team_average": {},
@@ -141,15 +122,17 @@ class DataAnalysisStep(StepBase):
             "individual_analysis": []
         }
         
-        # Calculate team averages
-        for metric in metrics:
-            q1_total = sum(member["performance"][metric]["Q1"] for member in team_data)
-            q2_total = sum(member["performance"][metric]["Q2"] for member in team_data)
-            q3_total = sum(member["performance"][metric]["Q3"] for member in team_data)
-            
-            q1_avg = round(q1_total / len(team_data), 1)
-            q2_avg = round(q2_total / len(team_data), 1)
-            q3_avg = round(q3_total / len(team_data), 1)
+        # Calculate team averages from the scores packed once per member, so each
+        # metric is a walk over a column instead of three nested dict lookups per member
+        scores = self._pack_scores(team_data, metrics)
+        member_count = len(team_data)
+        for j, metric in enumerate(metrics):
+            # One pass over the members splits the column into per-quarter scores;
+            # sum() is kept so totals match its float summation exactly
+            q1_scores, q2_scores, q3_scores = zip(*[member_scores[j] for member_scores in scores])
+            q1_avg = round(sum(q1_scores) / member_count, 1)
+            q2_avg = round(sum(q2_scores) / member_count, 1)
+            q3_avg = round(sum(q3_scores) / member_count, 1)
             
             results["team_average"][metric] = {
                 "Q1": q1_avg,
@@ -168,21 +151,15 @@ class DataAnalysisStep(StepBase):
             }
         
         # Individual analysis
-        for member in team_data:
+        for member, member_scores in zip(team_data, scores):
             member_id = member["member"]["id"]
             member_name = member["member"]["name"]
             
-            strengths = []
-            improvement_areas = []
-            
-            # Find strengths and areas for improvement
-            for metric in metrics:
-                q3_score = member["performance"][metric]["Q3"]
-                
-                if q3_score >= 4.0:
-                    strengths.append(metric)
-                elif q3_score <= 3.0:
-                    improvement_areas.append(metric)
+            # Find strengths and areas for improvement (fixed once built, so tuples)
+            # by masking the metrics with each Q3 threshold test
+            q3_scores = [quarters[2] for quarters in member_scores]
+            strengths = tuple(compress(metrics, [q3_score >= 4.0 for q3_score in q3_scores]))
+            improvement_areas = tuple(compress(metrics, [q3_score <= 3.0 for q3_score in q3_scores]))
             
             results["individual_analysis"].append({
                 "member_id": member_id,
@@ -194,58 +171,78 @@ class DataAnalysisStep(StepBase):
         
         return results
     
+    def _pack_scores(self, team_data: list, metrics: tuple) -> list:
+        """
+        Pack every member's quarterly scores into nested tuples.
+        
+        Args:
+            team_data: The team performance data.
+            metrics: The metrics to pack, in order.
+            
+        Returns:
+            list: One tuple per member holding a (Q1, Q2, Q3) tuple per metric.
+        """
+        packed = []
+        for member in team_data:
+            performance = member["performance"]
+            packed.append(tuple(
+                (performance[metric]["Q1"], performance[metric]["Q2"], performance[metric]["Q3"])
+                for metric in metrics
+            ))
+        return packed
+    
     def _calculate_overall_rating(self, performance: dict) -> float:
         """Calculate overall rating based on Q3 performance"""
-        metrics = performance.keys()
-        total = sum(performance[metric]["Q3"] for metric in metrics)
-        return round(total / len(metrics), 1)
+        metric_scores = performance.values()
+        total = sum(quarters["Q3"] for quarters in metric_scores)
+        return round(total / len(metric_scores), 1)
     
     def _generate_summary(self, analysis: dict) -> str:
         """Generate a markdown summary of the analysis results"""
-        summary = "# Performance Data Analysis Summary\n\n"
+        parts = ["# Performance Data Analysis Summary\n\n"]
         
-        summary += "## Team Performance Trends\n\n"
-        summary += "| Metric | Q1 | Q2 | Q3 | Q2→Q3 Trend |\n"
-        summary += "|--------|----|----|----|-----------|\n"
+        parts.append("## Team Performance Trends\n\n")
+        parts.append("| Metric | Q1 | Q2 | Q3 | Q2→Q3 Trend |\n")
+        parts.append("|--------|----|----|----|-----------|\n")
         
         for metric in analysis["team_average"].keys():
-            display_metric = metric.replace('_', ' ').title()
+            metric_label = display_metric(metric)
             q1 = analysis["team_average"][metric]["Q1"]
             q2 = analysis["team_average"][metric]["Q2"]
             q3 = analysis["team_average"][metric]["Q3"]
             trend = analysis["trends"][metric]["Q2_to_Q3"]
             trend_str = f"+{trend}%" if trend > 0 else f"{trend}%"
             
-            summary += f"| {display_metric} | {q1} | {q2} | {q3} | {trend_str} |\n"
+            parts.append(f"| {metric_label} | {q1} | {q2} | {q3} | {trend_str} |\n")
         
-        summary += "\n## Individual Performance Highlights\n\n"
+        parts.append("\n## Individual Performance Highlights\n\n")
         
         for individual in analysis["individual_analysis"]:
-            summary += f"### {individual['member_name']} (Overall: {individual['overall_rating']})\n\n"
+            parts.append(f"### {individual['member_name']} (Overall: {individual['overall_rating']})\n\n")
             
-            summary += "**Strengths:** "
+            parts.append("**Strengths:** ")
             if individual["strengths"]:
-                strengths = [s.replace('_', ' ').title() for s in individual["strengths"]]
-                summary += ", ".join(strengths)
+                strengths = [display_metric(s) for s in individual["strengths"]]
+                parts.append(", ".join(strengths))
             else:
-                summary += "None identified"
-            summary += "\n\n"
+                parts.append("None identified")
+            parts.append("\n\n")
             
-            summary += "**Areas for Improvement:** "
+            parts.append("**Areas for Improvement:** ")
             if individual["improvement_areas"]:
-                areas = [a.replace('_', ' ').title() for a in individual["improvement_areas"]]
-                summary += ", ".join(areas)
+                areas = [display_metric(a) for a in individual["improvement_areas"]]
+                parts.append(", ".join(areas))
             else:
-                summary += "None identified"
-            summary += "\n\n"
+                parts.append("None identified")
+            parts.append("\n\n")
         
-        summary += "## Recommendations\n\n"
-        summary += "1. Focus on team-wide improvements in " + self._get_lowest_metric(analysis) + "\n"
-        summary += "2. Recognize and share best practices from high performers\n"
-        summary += "3. Consider targeted training for individuals with specific improvement areas\n"
-        summary += "4. Continue to monitor trends into the next quarter\n"
+        parts.append("## Recommendations\n\n")
+        parts.append("1. Focus on team-wide improvements in " + self._get_lowest_metric(analysis) + "\n")
+        parts.append("2. Recognize and share best practices from high performers\n")
+        parts.append("3. Consider targeted training for individuals with specific improvement areas\n")
+        parts.append("4. Continue to monitor trends into the next quarter\n")
         
-        return summary
+        return "".join(parts)
     
     def _get_lowest_metric(self, analysis: dict) -> str:
         """Get the lowest performing metric for the team"""
@@ -259,4 +256,4 @@ class DataAnalysisStep(StepBase):
                 lowest_score = score
                 lowest_metric = metric
         
-        return lowest_metric.replace('_', ' ').title() if lowest_metric else "all areas"
+        return display_metric(lowest_metric) if lowest_metric else "all areas"
@@ -1,8 +1,94 @@
 import os
 import json
+import hashlib
+from collections import Counter
+from functools import partial
+from itertools import chain
+from types import MappingProxyType
+from agent.metrics import display_metric
 from agent.step_base import StepBase
 from loguru import logger
 
+# Quarter-over-quarter trend labels, keyed by the sign of the Q3 - Q2 change
+_TREND_LABELS = MappingProxyType({1: "↑ Improving", -1: "↓ Declining", 0: "→ Stable"})
+
+# Evaluation sentences for each strength, keyed by metric label; {name} is the member's name
+_STRENGTH_TEXT = MappingProxyType({
+    "Code Quality": (
+        "{name} consistently delivers well-structured, maintainable code "
+        "with appropriate documentation and test coverage."
+    ),
+    "Productivity": (
+        "{name} has demonstrated high productivity, "
+        "efficiently completing tasks and consistently meeting deadlines."
+    ),
+    "Collaboration": (
+        "{name} works effectively with team members, "
+        "actively participates in discussions, and provides valuable input to the team."
+    ),
+    "Innovation": (
+        "{name} regularly contributes innovative ideas "
+        "and approaches to solving problems."
+    ),
+    "Reliability": (
+        "{name} is highly reliable, consistently delivering on commitments "
+        "and maintaining high standards of work."
+    ),
+    "Customer Focus": (
+        "{name} demonstrates strong customer focus, "
+        "understanding user needs and delivering solutions that address those needs effectively."
+    )
+})
+
+# Evaluation suggestions for each improvement area, keyed by metric label
+_IMPROVEMENT_TEXT = MappingProxyType({
+    "Code Quality": (
+        "Consider investing more time in code reviews, writing unit tests, "
+        "and ensuring code is well-documented and maintainable."
+    ),
+    "Productivity": (
+        "Focus on time management and prioritization to increase productivity. "
+        "Consider techniques like time-blocking or the Pomodoro method."
+    ),
+    "Collaboration": (
+        "Seek more opportunities to collaborate with team members, "
+        "actively participate in discussions, and share knowledge."
+    ),
+    "Innovation": (
+        "Challenge yourself to think creatively about problems and solutions. "
+        "Consider dedicating time to explore new technologies or approaches."
+    ),
+    "Reliability": (
+        "Work on setting realistic expectations and consistently meeting commitments. "
+        "Communicate proactively if you anticipate challenges in meeting deadlines."
+    ),
+    "Customer Focus": (
+        "Deepen your understanding of user needs and perspectives. "
+        "Consider participating in user research or customer interviews."
+    )
+})
+
+# Recommendations for each strength, keyed by metric
+_STRENGTH_RECOMMENDATIONS = MappingProxyType({
+    "code_quality": "Share code quality best practices with the team through knowledge sharing sessions",
+    "productivity": "Consider mentoring others on productivity techniques and strategies",
+    "collaboration": "Take on more leadership opportunities in team settings",
+    "innovation": "Explore innovation time to pursue new ideas or improvements",
+    "reliability": "Continue building on reliability by taking on more responsibility",
+    "customer_focus": "Consider participating in customer-facing activities to further leverage this strength"
+})
+
+# Recommendations for each improvement area, keyed by metric
+_IMPROVEMENT_RECOMMENDATIONS = MappingProxyType({
+    "code_quality": "Complete a course on software quality and testing practices",
+    "productivity": "Practice time management techniques and use productivity tools",
+    "collaboration": "Increase participation in team meetings and collaborative projects",
+    "innovation": "Dedicate time to exploring new technologies or approaches",
+    "reliability": "Develop a more structured approach to planning and tracking work",
+    "customer_focus": "Participate in user research or customer interviews to better understand needs"
+})
+
+
 class EvaluationGenerationStep(StepBase):
     """
     Implementation of the Evaluation Generation step.
@@ -10,6 +96,10 @@ class EvaluationGenerationStep(StepBase):
     This step generates performance evaluations based on the analysis of data and feedback.
     """
     
+    # Reuse outputs generated from identical inputs; turn off while
+    # developing the evaluation text itself
+    use_cache = True
+    
     def execute(self) -> bool:
         """
         Execute the step.
@@ -31,10 +121,6 @@ class EvaluationGenerationStep(StepBase):
             logger.error("Analysis results not found. Please run data_analysis step first.")
             return False
         
-        # Load analysis results
-        with open(analysis_path, "r", encoding="utf-8") as f:
-            analysis_data = json.load(f)
-        
         # Also read the team data
         team_data_path = os.path.join(
             os.path.dirname(os.path.dirname(self.input_dir)),
@@ -47,46 +133,102 @@ class EvaluationGenerationStep(StepBase):
             logger.error("Team data not found. Please run data_analysis step first.")
             return False
         
-        # Load team data
-        with open(team_data_path, "r", encoding="utf-8") as f:
-            team_data = json.load(f)
+        # Read the raw inputs first; their bytes key the output cache
+        try:
+            with open(analysis_path, "rb") as f:
+                analysis_bytes = f.read()
+            with open(team_data_path, "rb") as f:
+                team_data_bytes = f.read()
+        except OSError as e:
+            logger.error(f"An OS error occurred while reading the evaluation inputs: {e}")
+            return False
+        
+        # The evaluations depend only on the two input files, so reuse the
+        # outputs generated from identical inputs last time
+        cache_key = self._cache_key(analysis_bytes, team_data_bytes) if self.use_cache else None
+        if cache_key and self.restore_cached_outputs(cache_key):
+            logger.info("Evaluation inputs unchanged, reusing cached outputs")
+            return True
+        
+        # Parse the bytes already read for the cache key 
+        try:
+            analysis_data = self.parse_json(analysis_bytes)
+            team_data = self.parse_json(team_data_bytes)
+        except json.JSONDecodeError as e:
+            logger.error(f"Error decoding the evaluation inputs: {e}")
+            return False
         
         # Generate evaluations
         evaluations = self._generate_evaluations(analysis_data, team_data)
         
         # Write evaluations to output
-        self.write_output_file("evaluations.json", json.dumps(evaluations, indent=2))
-        
-        # Also write a markdown summary for each team member
-        for member_eval in evaluations:
-            member_name = member_eval["member_name"].replace(" ", "_").lower()
-            self.write_output_file(
-                f"{member_name}_evaluation.md",
-                self._generate_evaluation_markdown(member_eval)
-            )
+        self.write_output_json("evaluations.json", evaluations)
+        output_files = ["evaluations.json"]
+        
+        # Also write a markdown summary for each team member; the files are
+        # independent, so overlap their writes
+        member_jobs = [
+            (f"{self.member_slug(member_eval['member_name'])}_evaluation.md",
+             partial(self._write_member_evaluation, member_eval))
+            for member_eval in evaluations
+        ]
+        if not self.write_outputs_concurrently(member_jobs):
+            return False
+        output_files.extend(filename for filename, _ in member_jobs)
         
         # Write a summary markdown file
         self.write_output_file(
             "evaluation_summary.md",
             self._generate_summary_markdown(evaluations)
         )
+        output_files.append("evaluation_summary.md")
+        
+        if cache_key:
+            self.save_cached_outputs(cache_key, output_files)
         
         return True
     
+    def _cache_key(self, analysis_bytes: bytes, team_data_bytes: bytes) -> str:
+        """
+        Compute the output cache key from the contents of the input files.
+        
+        Args:
+            analysis_bytes: The raw analysis results JSON.
+            team_data_bytes: The raw team data JSON.
+            
+        Returns:
+            str: The hex BLAKE2b digest identifying the outputs.
+        """
+        hasher = hashlib.blake2b(analysis_bytes, digest_size=16)
+        hasher.update(b"|")
+        hasher.update(team_data_bytes)
+        return hasher.hexdigest()
+    
+    def _write_member_evaluation(self, member_eval: dict, filename: str) -> None:
+        """
+        Write the markdown evaluation for one team member.
+        
+        Args:
+            member_eval: The member's evaluation.
+            filename: The name of the output file.
+        """
+        self.write_output_file(filename, self._generate_evaluation_markdown(member_eval))
+    
     def _generate_evaluations(self, analysis_data, team_data):
         """Generate evaluations for each team member"""
         evaluations = []
         
         individual_analyses = analysis_data.get("individual_analysis", [])
         
+        # Index the team data by member id; built from the end so the first
+        # entry wins if an id is repeated
+        team_by_id = {m["member"]["id"]: m for m in reversed(team_data)}
+        
         for analysis in individual_analyses:
             member_id = analysis["member_id"]
             
             # Find the team member data
-            member_data = next(
-                (m for m in team_data if m["member"]["id"] == member_id),
-                None
-            )
+            member_data = team_by_id.get(member_id)
             
             if not member_data:
                 continue
@@ -111,8 +253,8 @@ class EvaluationGenerationStep(StepBase):
     
     def _generate_evaluation_text(self, analysis, member_data):
         """Generate evaluation text for a team member"""
-        strengths = [s.replace("_", " ").title() for s in analysis["strengths"]]
-        improvement_areas = [a.replace("_", " ").title() for a in analysis["improvement_areas"]]
+        strengths = [display_metric(s) for s in analysis["strengths"]]
+        improvement_areas = [display_metric(a) for a in analysis["improvement_areas"]]
         
         evaluation_text = []
         
@@ -151,77 +293,21 @@ class EvaluationGenerationStep(StepBase):
             )
             
             # Add specific comments for each strength
-            for strength in strengths:
-                if strength == "Code Quality":
-                    evaluation_text.append(
-                        f"{analysis['member_name']} consistently delivers well-structured, maintainable code "
-                        "with appropriate documentation and test coverage."
-                    )
-                elif strength == "Productivity":
-                    evaluation_text.append(
-                        f"{analysis['member_name']} has demonstrated high productivity, "
-                        "efficiently completing tasks and consistently meeting deadlines."
-                    )
-                elif strength == "Collaboration":
-                    evaluation_text.append(
-                        f"{analysis['member_name']} works effectively with team members, "
-                        "actively participates in discussions, and provides valuable input to the team."
-                    )
-                elif strength == "Innovation":
-                    evaluation_text.append(
-                        f"{analysis['member_name']} regularly contributes innovative ideas "
-                        "and approaches to solving problems."
-                    )
-                elif strength == "Reliability":
-                    evaluation_text.append(
-                        f"{analysis['member_name']} is highly reliable, consistently delivering on commitments "
-                        "and maintaining high standards of work."
-                    )
-                elif strength == "Customer Focus":
-                    evaluation_text.append(
-                        f"{analysis['member_name']} demonstrates strong customer focus, "
-                        "understanding user needs and delivering solutions that address those needs effectively."
-                    )
+            name_fields = {"name": analysis["member_name"]}
+            evaluation_text.extend(
+                _STRENGTH_TEXT[strength].format_map(name_fields)
+                for strength in strengths if strength in _STRENGTH_TEXT
+            )
         
         # Areas for improvement
         if improvement_areas:
             evaluation_text.append(
-                f"\\nAreas where {analysis['member_name']} could focus on improvement include "
+                f"\nAreas where {analysis['member_name']} could focus on improvement include "
                 f"{', '.join(improvement_areas[:-1]) + ' and ' + improvement_areas[-1] if len(improvement_areas) > 1 else improvement_areas[0]}."
             )
             
             # Add specific suggestions for each improvement area
-            for area in improvement_areas:
-                if area == "Code Quality":
-                    evaluation_text.append(
-                        "Consider investing more time in code reviews, writing unit tests, "
-                        "and ensuring code is well-documented and maintainable."
-                    )
-                elif area == "Productivity":
-                    evaluation_text.append(
-                        "Focus on time management and prioritization to increase productivity. "
-                        "Consider techniques like time-blocking or the Pomodoro method."
-                    )
-                elif area == "Collaboration":
-                    evaluation_text.append(
-                        "Seek more opportunities to collaborate with team members, "
-                        "actively participate in discussions, and share knowledge."
-                    )
-                elif area == "Innovation":
-                    evaluation_text.append(
-                        "Challenge yourself to think creatively about problems and solutions. "
-                        "Consider dedicating time to explore new technologies or approaches."
-                    )
-                elif area == "Reliability":
-                    evaluation_text.append(
-                        "Work on setting realistic expectations and consistently meeting commitments. "
-                        "Communicate proactively if you anticipate challenges in meeting deadlines."
-                    )
-                elif area == "Customer Focus":
-                    evaluation_text.append(
-                        "Deepen your understanding of user needs and perspectives. "
-                        "Consider participating in user research or customer interviews."
-                    )
+            evaluation_text.extend(_IMPROVEMENT_TEXT[area] for area in improvement_areas if area in _IMPROVEMENT_TEXT)
         
         # Project contributions
         if member_data["projects"]:
@@ -241,175 +327,100 @@ class EvaluationGenerationStep(StepBase):
             "Continue to leverage strengths while focusing on development areas"
         )
         
-        # Strength-based recommendations
-        for strength in analysis["strengths"]:
-            if strength == "code_quality":
-                recommendations.append(
-                    "Share code quality best practices with the team through knowledge sharing sessions"
-                )
-            elif strength == "productivity":
-                recommendations.append(
-                    "Consider mentoring others on productivity techniques and strategies"
-                )
-            elif strength == "collaboration":
-                recommendations.append(
-                    "Take on more leadership opportunities in team settings"
-                )
-            elif strength == "innovation":
-                recommendations.append(
-                    "Explore innovation time to pursue new ideas or improvements"
-                )
-            elif strength == "reliability":
-                recommendations.append(
-                    "Continue building on reliability by taking on more responsibility"
-                )
-            elif strength == "customer_focus":
-                recommendations.append(
-                    "Consider participating in customer-facing activities to further leverage this strength"
-                )
+        # Strength-based recommendations (one table lookup per metric; unknown
+        # metrics map to None and are dropped)
+        recommendations.extend(filter(None, map(_STRENGTH_RECOMMENDATIONS.get, analysis["strengths"])))
         
         # Improvement area recommendations
-        for area in analysis["improvement_areas"]:
-            if area == "code_quality":
-                recommendations.append(
-                    "Complete a course on software quality and testing practices"
-                )
-            elif area == "productivity":
-                recommendations.append(
-                    "Practice time management techniques and use productivity tools"
-                )
-            elif area == "collaboration":
-                recommendations.append(
-                    "Increase participation in team meetings and collaborative projects"
-                )
-            elif area == "innovation":
-                recommendations.append(
-                    "Dedicate time to exploring new technologies or approaches"
-                )
-            elif area == "reliability":
-                recommendations.append(
-                    "Develop a more structured approach to planning and tracking work"
-                )
-            elif area == "customer_focus":
-                recommendations.append(
-                    "Participate in user research or customer interviews to better understand needs"
-                )
+        recommendations.extend(filter(None, map(_IMPROVEMENT_RECOMMENDATIONS.get, analysis["improvement_areas"])))
         
         return recommendations
     
     def _generate_evaluation_markdown(self, evaluation):
         """Generate a markdown evaluation for a team member"""
-        markdown = f"# Performance Evaluation: {evaluation['member_name']}\n\n"
-        markdown += f"**Role:** {evaluation['role']}\n"
-        markdown += f"**Overall Rating:** {evaluation['overall_rating']}/5.0\n\n"
-        
-        markdown += "## Evaluation Summary\n\n"
-        markdown += f"{evaluation['evaluation_text']}\n\n"
-        
-        markdown += "## Performance Metrics\n\n"
-        markdown += "| Metric | Q1 | Q2 | Q3 | Trend |\n"
-        markdown += "|--------|----|----|----|-----------|\n"
-        
-        for metric, data in evaluation['performance'].items():
-            display_metric = metric.replace('_', ' ').title()
-            q1 = data["Q1"]
-            q2 = data["Q2"]
-            q3 = data["Q3"]
-            
-            trend = ""
-            if q3 > q2:
-                trend = "↑ Improving"
-            elif q3 < q2:
-                trend = "↓ Declining"
-            else:
-                trend = "→ Stable"
-            
-            markdown += f"| {display_metric} | {q1} | {q2} | {q3} | {trend} |\n"
+        parts = [f"# Performance Evaluation: {evaluation['member_name']}\n\n"]
+        parts.append(f"**Role:** {evaluation['role']}\n")
+        parts.append(f"**Overall Rating:** {evaluation['overall_rating']}/5.0\n\n")
+        
+        parts.append("## Evaluation Summary\n\n")
+        parts.append(f"{evaluation['evaluation_text']}\n\n")
+        
+        parts.append("## Performance Metrics\n\n")
+        parts.append("| Metric | Q1 | Q2 | Q3 | Trend |\n")
+        parts.append("|--------|----|----|----|-----------|\n")
+        
+        parts.append("".join([
+            f"| {display_metric(metric)} | {data['Q1']} | {data['Q2']} | {data['Q3']} | "
+            f"{_TREND_LABELS[(data['Q3'] > data['Q2']) - (data['Q3'] < data['Q2'])]} |\n"
+            for metric, data in evaluation['performance'].items()
+        ]))
         
-        markdown += "\n## Strengths\n\n"
+        parts.append("\n## Strengths\n\n")
         if evaluation["strengths"]:
             for strength in evaluation["strengths"]:
-                markdown += f"- {strength.replace('_', ' ').title()}\n"
+                parts.append(f"- {display_metric(strength)}\n")
         else:
-            markdown += "No specific strengths identified.\n"
+            parts.append("No specific strengths identified.\n")
         
-        markdown += "\n## Areas for Improvement\n\n"
+        parts.append("\n## Areas for Improvement\n\n")
         if evaluation["improvement_areas"]:
             for area in evaluation["improvement_areas"]:
-                markdown += f"- {area.replace('_', ' ').title()}\n"
+                parts.append(f"- {display_metric(area)}\n")
         else:
-            markdown += "No specific improvement areas identified.\n"
+            parts.append("No specific improvement areas identified.\n")
         
-        markdown += "\n## Projects\n\n"
+        parts.append("\n## Projects\n\n")
         if evaluation["projects"]:
             for project in evaluation["projects"]:
-                markdown += f"- {project}\n"
+                parts.append(f"- {project}\n")
         else:
-            markdown += "No projects assigned during this period.\n"
+            parts.append("No projects assigned during this period.\n")
         
-        markdown += "\n## Recommendations\n\n"
+        parts.append("\n## Recommendations\n\n")
         for recommendation in evaluation["recommendations"]:
-            markdown += f"- {recommendation}\n"
+            parts.append(f"- {recommendation}\n")
         
-        return markdown
+        return "".join(parts)
     
     def _generate_summary_markdown(self, evaluations):
         """Generate a summary markdown for all evaluations"""
-        markdown = "# Team Performance Evaluation Summary\n\n"
+        parts = ["# Team Performance Evaluation Summary\n\n"]
         
-        markdown += "## Overview\n\n"
+        parts.append("## Overview\n\n")
         
         average_rating = sum(e["overall_rating"] for e in evaluations) / len(evaluations)
-        markdown += f"Team Average Rating: {average_rating:.1f}/5.0\n\n"
+        parts.append(f"Team Average Rating: {average_rating:.1f}/5.0\n\n")
         
-        markdown += "## Individual Ratings\n\n"
-        markdown += "| Team Member | Role | Rating | Top Strength | Primary Development Area |\n"
-        markdown += "|------------|------|--------|-------------|-------------------------|\\n"
+        parts.append("## Individual Ratings\n\n")
+        parts.append("| Team Member | Role | Rating | Top Strength | Primary Development Area |\n")
+        parts.append("|------------|------|--------|-------------|-------------------------|\n")
         
         for eval_item in evaluations:
             name = eval_item["member_name"]
             role = eval_item["role"]
             rating = eval_item["overall_rating"]
             
-            top_strength = eval_item["strengths"][0].replace("_", " ").title() if eval_item["strengths"] else "N/A"
-            top_improvement = eval_item["improvement_areas"][0].replace("_", " ").title() if eval_item["improvement_areas"] else "N/A"
+            top_strength = display_metric(eval_item["strengths"][0]) if eval_item["strengths"] else "N/A"
+            top_improvement = display_metric(eval_item["improvement_areas"][0]) if eval_item["improvement_areas"] else "N/A"
             
-            markdown += f"| {name} | {role} | {rating} | {top_strength} | {top_improvement} |\\n"
+            parts.append(f"| {name} | {role} | {rating} | {top_strength} | {top_improvement} |\n")
         
-        markdown += "\\n## Common Strengths\\n\\n"
+        parts.append("\n## Common Strengths\n\n")
         
-        # Collect all strengths
-        all_strengths = {}
-        for eval_item in evaluations:
-            for strength in eval_item["strengths"]:
-                if strength in all_strengths:
-                    all_strengths[strength] += 1
-                else:
-                    all_strengths[strength] = 1
-        
-        # Sort by frequency
-        sorted_strengths = sorted(all_strengths.items(), key=lambda x: x[1], reverse=True)
+        # Collect all strengths, sorted by frequency
+        sorted_strengths = Counter(chain.from_iterable(e["strengths"] for e in evaluations)).most_common()
         
         for strength, count in sorted_strengths:
-            display_strength = strength.replace("_", " ").title()
-            markdown += f"- {display_strength}: {count} team members\n"
+            display_strength = display_metric(strength)
+            parts.append(f"- {display_strength}: {count} team members\n")
         
-        markdown += "\n## Common Development Areas\n\n"
-        
-        # Collect all improvement areas
-        all_improvements = {}
-        for eval_item in evaluations:
-            for area in eval_item["improvement_areas"]:
-                if area in all_improvements:
-                    all_improvements[area] += 1
-                else:
-                    all_improvements[area] = 1
+        parts.append("\n## Common Development Areas\n\n")
         
-        # Sort by frequency
-        sorted_improvements = sorted(all_improvements.items(), key=lambda x: x[1], reverse=True)
+        # Collect all improvement areas, sorted by frequency
+        sorted_improvements = Counter(chain.from_iterable(e["improvement_areas"] for e in evaluations)).most_common()
         
         for area, count in sorted_improvements:
-            display_area = area.replace("_", " ").title()
-            markdown += f"- {display_area}: {count} team members\n"
+            display_area = display_metric(area)
+            parts.append(f"- {display_area}: {count} team members\n")
         
-        return markdown
+        return "".join(parts)
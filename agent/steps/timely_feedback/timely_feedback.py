@@ -1,10 +1,241 @@
 import os
-import json
+import re
 import random
+import hashlib
 from datetime import datetime, timedelta
+from functools import partial
+from typing import Optional
+from types import MappingProxyType
 from agent.step_base import StepBase
 from loguru import logger
 
+# Role-specific accomplishment templates
+_ROLE_ACCOMPLISHMENTS = MappingProxyType({
+    "Software Engineer": (
+        "Implemented {feature} which improved {metric} by {percentage}%",
+        "Refactored {component} resulting in {benefit}",
+        "Fixed {number} critical bugs in {project} ahead of deadline",
+        "Designed and implemented {architecture} to support {need}",
+        "Improved test coverage for {project} by {percentage}%"
+    ),
+    "UX Designer": (
+        "Completed user research for {project} revealing key insights about {area}",
+        "Redesigned {feature} which led to {percentage}% increase in user satisfaction",
+        "Created {deliverable} for {project} that was well-received by stakeholders",
+        "Conducted {number} usability tests identifying {benefit}",
+        "Implemented design system improvements for {benefit}"
+    ),
+    "Product Manager": (
+        "Led successful launch of {feature} resulting in {benefit}",
+        "Defined product requirements for {project} that aligned team efforts",
+        "Prioritized backlog effectively, increasing team velocity by {percentage}%",
+        "Gathered customer feedback that led to {benefit}",
+        "Facilitated cross-team coordination for {project}"
+    ),
+    "Data Scientist": (
+        "Developed {model} that improved prediction accuracy by {percentage}%",
+        "Analyzed {dataset} revealing insights about {area}",
+        "Implemented {technique} resulting in {benefit}",
+        "Optimized {process} reducing processing time by {percentage}%",
+        "Created dashboard for {metric} that improved decision-making"
+    ),
+    "DevOps Engineer": (
+        "Improved CI/CD pipeline reducing build time by {percentage}%",
+        "Implemented {tool} for {benefit}",
+        "Resolved {number} infrastructure issues improving system stability",
+        "Set up monitoring for {component} providing {benefit}",
+        "Reduced cloud costs by {percentage}% through {technique}"
+    )
+})
+
+# Accomplishment templates for roles without their own
+_GENERIC_ACCOMPLISHMENTS = (
+    "Completed {project} milestone ahead of schedule",
+    "Contributed significantly to {project} success",
+    "Demonstrated expertise in {area} that helped the team",
+    "Took initiative on {task} that led to {benefit}",
+    "Collaborated effectively with {team} to deliver {outcome}"
+)
+
+# Choices for the accomplishment template placeholders
+_FEATURES = ("user authentication", "data visualization", "reporting module", "search functionality", "notification system")
+_COMPONENTS = ("backend services", "frontend components", "database layer", "API endpoints", "authentication system")
+_ARCHITECTURES = ("microservice architecture", "event-driven system", "caching layer", "data pipeline", "serverless functions")
+_NEEDS = ("scalability", "high availability", "real-time processing", "data integrity", "future growth")
+_AREAS = ("user behavior", "performance bottlenecks", "customer preferences", "market trends", "system integration")
+_DELIVERABLES = ("wireframes", "prototypes", "user flow diagrams", "style guide", "interaction models")
+_MODELS = ("prediction algorithm", "classification model", "recommendation system", "anomaly detection", "time series forecast")
+_DATASETS = ("customer behavior data", "system performance logs", "market research", "user feedback", "operational metrics")
+_TECHNIQUES = ("containerization", "infrastructure as code", "automated testing", "data preprocessing", "feature engineering")
+_PROCESSES = ("ETL pipeline", "build process", "deployment workflow", "data ingestion", "reporting cycle")
+_TOOLS = ("Kubernetes", "Terraform", "ELK stack", "Prometheus", "Jenkins")
+_TASKS = ("performance optimization", "documentation", "cross-team coordination", "risk assessment", "customer outreach")
+_TEAMS = ("engineering", "product", "design", "marketing", "customer support")
+_OUTCOMES = ("successful release", "improved metrics", "positive customer feedback", "system stability", "new capability")
+_ACCOMPLISHMENT_METRICS = ("performance", "user engagement", "conversion rate", "system uptime", "customer satisfaction")
+_BENEFITS = ("improved maintainability", "faster performance", "better user experience", "reduced costs", "increased reliability")
+
+# Accomplishment template placeholders drawn from a fixed set of choices
+_FIELD_CHOICES = MappingProxyType({
+    "feature": _FEATURES,
+    "component": _COMPONENTS,
+    "architecture": _ARCHITECTURES,
+    "need": _NEEDS,
+    "area": _AREAS,
+    "deliverable": _DELIVERABLES,
+    "model": _MODELS,
+    "dataset": _DATASETS,
+    "technique": _TECHNIQUES,
+    "process": _PROCESSES,
+    "tool": _TOOLS,
+    "task": _TASKS,
+    "team": _TEAMS,
+    "outcome": _OUTCOMES,
+    "metric": _ACCOMPLISHMENT_METRICS,
+    "benefit": _BENEFITS
+})
+
+# Accomplishment template placeholders drawn from an inclusive integer range
+_FIELD_RANGES = MappingProxyType({
+    "percentage": (10, 50),
+    "number": (3, 12)
+})
+
+# General positive feedback templates
+_POSITIVE_TEMPLATES = (
+    "Your {quality} in {context} has been particularly impressive",
+    "I've noticed your exceptional {quality} while working on {context}",
+    "Your recent work demonstrates strong {quality}, especially in {context}",
+    "You've shown excellent {quality} that has {impact}",
+    "The team has benefited from your {quality} in {context}"
+)
+
+# Role-specific qualities
+_ROLE_QUALITIES = MappingProxyType({
+    "Software Engineer": ("technical expertise", "problem-solving ability", "attention to code quality", "architectural thinking", "debugging skills"),
+    "UX Designer": ("design thinking", "user empathy", "visual communication", "attention to detail", "innovative solutions"),
+    "Product Manager": ("strategic thinking", "stakeholder management", "prioritization skills", "customer focus", "communication clarity"),
+    "Data Scientist": ("analytical rigor", "data interpretation", "statistical expertise", "insight generation", "technical communication"),
+    "DevOps Engineer": ("system reliability focus", "automation expertise", "proactive monitoring", "troubleshooting ability", "security mindset")
+})
+
+_GENERIC_QUALITIES = ("teamwork", "initiative", "reliability", "adaptability", "communication")
+
+_IMPACTS = (
+    "positively impacted the team's performance",
+    "contributed to our success",
+    "helped us meet our objectives",
+    "improved our delivery process",
+    "enhanced our product quality"
+)
+
+# Role-specific improvement areas
+_ROLE_IMPROVEMENTS = MappingProxyType({
+    "Software Engineer": (
+        "Consider adding more comprehensive tests to ensure code reliability",
+        "Documentation could be more detailed for complex functions",
+        "Breaking down large pull requests into smaller ones would make reviews easier",
+        "More proactive communication about technical challenges would help with planning"
+    ),
+    "UX Designer": (
+        "Including more context in design presentations would help stakeholders understand decisions",
+        "Earlier sharing of design concepts could help catch issues sooner",
+        "More detailed documentation of user research findings would benefit the team",
+        "Consider more diverse user personas in testing scenarios"
+    ),
+    "Product Manager": (
+        "More detailed acceptance criteria would help development teams",
+        "Earlier communication about scope changes would improve planning",
+        "More frequent check-ins with development teams could prevent misalignment",
+        "Consider gathering more quantitative data to support feature decisions"
+    ),
+    "Data Scientist": (
+        "More documentation of methodologies would help others understand your approach",
+        "Consider simpler models for initial solutions before optimizing",
+        "More context in presentations would help non-technical stakeholders",
+        "Earlier sharing of preliminary findings could guide project direction"
+    ),
+    "DevOps Engineer": (
+        "More documentation for system configurations would help team knowledge",
+        "Consider more proactive communication about infrastructure changes",
+        "Involving developers earlier in deployment planning could improve outcomes",
+        "More comprehensive monitoring alerts would help catch issues sooner"
+    )
+})
+
+_GENERIC_IMPROVEMENTS = (
+    "More proactive communication would help with team coordination",
+    "Consider documenting your process to help knowledge sharing",
+    "Earlier flagging of potential issues would help with risk management",
+    "More detailed updates in team meetings would improve visibility"
+)
+
+# Feedback themes, in priority order, and the action item each one calls for.
+# Each theme is searched for on its own: the patterns can overlap (e.g.
+# "alertest" holds both "alert" and "test"), which a single alternation
+# scanning the text once would miss
+_ACTION_THEMES = tuple((re.compile(pattern, re.IGNORECASE), action) for pattern, action in (
+    (r"documentation", "Create a documentation template for future work"),
+    (r"communication", "Schedule regular check-ins with team members"),
+    (r"test", "Implement test-driven development approach"),
+    (r"review|pull request", "Break down large changes into smaller, focused pull requests"),
+    (r"design", "Share design concepts earlier in the process"),
+    (r"data", "Create a data collection and analysis plan"),
+    (r"monitoring|alert", "Review and enhance monitoring system")
+))
+
+# Extra action items offered when feedback yields fewer than two
+_GENERIC_ACTIONS = (
+    "Schedule a follow-up discussion to review progress",
+    "Document learnings and share with the team",
+    "Identify a mentor who excels in this area",
+    "Research best practices and create a personal guide"
+)
+
+# Markdown templates for the per-member feedback report and its summary entry
+_FEEDBACK_HEADER = (
+    "# Timely Feedback for {name}\n\n"
+    "**Role:** {role}\n\n"
+    "**Date:** {date}\n\n"
+    "**Follow-up Date:** {follow_up_date}\n\n"
+    "## Recent Accomplishments\n\n"
+)
+
+_SUMMARY_MEMBER_BLOCK = (
+    "### {name} ({role})\n\n"
+    "- **Accomplishments:** {accomplishments}\n"
+    "- **Positive Feedback Items:** {positive}\n"
+    "- **Areas for Growth:** {constructive}\n"
+    "- **Action Items:** {actions}\n"
+    "- **Follow-up Date:** {follow_up_date}\n\n"
+)
+
+
+class _AccomplishmentFields(dict):
+    """
+    Values for the placeholders of one accomplishment template.
+    
+    Used with str.format_map: a value is only drawn the first time the template
+    references its placeholder, so a template naming two fields costs two draws
+    instead of one for every known field.
+    """
+    
+    def __init__(self, projects: list, rng: random.Random):
+        super().__init__()
+        self._projects = projects
+        self._rng = rng
+    
+    def __missing__(self, key: str):
+        if key == "project":
+            value = self._rng.choice(self._projects) if self._projects else "the project"
+        elif key in _FIELD_RANGES:
+            value = self._rng.randint(*_FIELD_RANGES[key])
+        else:
+            value = self._rng.choice(_FIELD_CHOICES[key])
+        self[key] = value
+        return value
+
+
 class TimelyFeedbackStep(StepBase):
     """
     Implementation of the Timely Feedback step.
@@ -12,6 +243,16 @@ class TimelyFeedbackStep(StepBase):
     This step generates timely feedback for team members based on recent accomplishments and behaviors.
     """
     
+    # Reuse feedback generated from identical team data on the same day; turn
+    # off to draw fresh feedback on every run
+    use_cache = True
+    
+    def __init__(self, step_id: str, input_dir: str, output_dir: str):
+        super().__init__(step_id, input_dir, output_dir)
+        # Private generator, so a run can be seeded without touching the
+        # module-level random functions' shared state
+        self._rng = random.Random()
+    
     def execute(self) -> bool:
         """
         Execute the step.
@@ -33,191 +274,155 @@ class TimelyFeedbackStep(StepBase):
             logger.error("Team data not found. Please run data_analysis step first.")
             return False
         
-        # Load team data
-        with open(team_data_path, "r", encoding="utf-8") as f:
-            team_data = json.load(f)
+        # Unchanged team data produces the same feedback, so reuse the outputs
+        # generated from it earlier today
+        cache_key = self._cache_key(team_data_path) if self.use_cache else None
+        if cache_key and self.restore_cached_outputs(cache_key):
+            logger.info("Team data unchanged, reusing cached timely feedback")
+            return True
+        
+        # Load team data (shared with other steps reading the same file)
+        team_data = self.read_json_cached(team_data_path)
+        
+        # Seed from the cache key so the same inputs always produce the same
+        # feedback, whether it is generated or restored from the cache
+        if cache_key:
+            self._rng.seed(int(cache_key[:16], 16))
         
         # Generate timely feedback
         feedback_data = self._generate_timely_feedback(team_data)
         
-        # Write feedback data to output
-        self.write_output_file("timely_feedback.json", json.dumps(feedback_data, indent=2))
-        
-        # Also write a markdown summary for each team member
-        for member_feedback in feedback_data:
-            member_name = member_feedback["member"]["name"].replace(" ", "_").lower()
-            self.write_output_file(
-                f"{member_name}_feedback.md",
-                self._generate_feedback_markdown(member_feedback)
-            )
+        # Write the feedback data, a markdown report for each team member and a
+        # summary markdown file. Every output file is independent, so all the
+        # writes overlap on one pool
+        jobs = [
+            (f"{self.member_slug(member_feedback['member']['name'])}_feedback.md",
+             partial(self._write_member_feedback, member_feedback))
+            for member_feedback in feedback_data
+        ]
+        jobs.append(("feedback_summary.md", partial(self._write_summary, feedback_data)))
+        # Serialized with orjson when it is installed
+        jobs.append(("timely_feedback.json", partial(self.write_output_json, data=feedback_data)))
+        if not self.write_outputs_concurrently(jobs):
+            return False
         
-        # Write a summary markdown file
-        self.write_output_file(
-            "feedback_summary.md",
-            self._generate_summary_markdown(feedback_data)
-        )
+        if cache_key:
+            self.save_cached_outputs(cache_key, [filename for filename, _ in jobs])
         
         return True
     
+    def _cache_key(self, team_data_path: str) -> Optional[str]:
+        """
+        Compute the output cache key from the team data.
+        
+        Besides the file contents, the key covers the run date, since the
+        feedback and follow-up dates are derived from it.
+        
+        Args:
+            team_data_path: The path to the team data.
+            
+        Returns:
+            Optional[str]: The hex BLAKE2b digest identifying the outputs, or None if the file cannot be read.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        try:
+            with open(team_data_path, "rb") as f:
+                hasher.update(f.read())
+        except OSError as e:
+            logger.warning(f"Could not hash team data, skipping the cache: {e}")
+            return None
+        hasher.update(f"|{datetime.now().date().isoformat()}".encode("utf-8"))
+        return hasher.hexdigest()
+    
     def _generate_timely_feedback(self, team_data):
         """Generate timely feedback for each team member"""
-        feedback_data = []
+        # Members are generated in order rather than in parallel: every member
+        # draws from the step's seeded generator, so a run only reproduces
+        # when the draws happen in the same sequence
+        return [self._feedback_for_member(member_data) for member_data in team_data]
+    
+    def _feedback_for_member(self, member_data):
+        """Generate timely feedback for one team member"""
+        member = member_data["member"]
+        role = member["role"]
+        projects = member_data["projects"]
+        
+        # Generate random recent accomplishments
+        accomplishments = self._generate_accomplishments(role, projects)
+        
+        # Generate positive and constructive feedback
+        positive_feedback = self._generate_positive_feedback(role, accomplishments)
+        constructive_feedback = self._generate_constructive_feedback(role)
+        
+        # Generate feedback data
+        return {
+            "member": member,
+            "date": datetime.now().strftime("%Y-%m-%d"),
+            "recent_accomplishments": accomplishments,
+            "positive_feedback": positive_feedback,
+            "constructive_feedback": constructive_feedback,
+            "action_items": self._generate_action_items(constructive_feedback),
+            "follow_up_date": (datetime.now() + timedelta(days=self._rng.randint(14, 30))).strftime("%Y-%m-%d")
+        }
+    
+    def _write_member_feedback(self, member_feedback: dict, filename: str) -> None:
+        """
+        Write the markdown feedback report for one team member.
         
-        for member_data in team_data:
-            member = member_data["member"]
-            role = member["role"]
-            projects = member_data["projects"]
-            
-            # Generate random recent accomplishments
-            accomplishments = self._generate_accomplishments(role, projects)
-            
-            # Generate positive and constructive feedback
-            positive_feedback = self._generate_positive_feedback(role, accomplishments)
-            constructive_feedback = self._generate_constructive_feedback(role)
-            
-            # Generate feedback data
-            feedback = {
-                "member": member,
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "recent_accomplishments": accomplishments,
-                "positive_feedback": positive_feedback,
-                "constructive_feedback": constructive_feedback,
-                "action_items": self._generate_action_items(constructive_feedback),
-                "follow_up_date": (datetime.now() + timedelta(days=random.randint(14, 30))).strftime("%Y-%m-%d")
-            }
-            
-            feedback_data.append(feedback)
+        Args:
+            member_feedback: The member's feedback.
+            filename: The name of the output file.
+        """
+        self.write_output_file(filename, self._generate_feedback_markdown(member_feedback))
+    
+    def _write_summary(self, feedback_data: list, filename: str) -> None:
+        """
+        Write the feedback summary markdown file.
         
-        return feedback_data
+        Args:
+            feedback_data: The feedback for every team member.
+            filename: The name of the output file.
+        """
+        self.write_output_file(filename, self._generate_summary_markdown(feedback_data))
     
     def _generate_accomplishments(self, role, projects):
         """Generate random recent accomplishments based on role and projects"""
         accomplishments = []
-        num_accomplishments = random.randint(2, 4)
-        
-        # Role-specific accomplishment templates
-        role_accomplishments = {
-            "Software Engineer": [
-                "Implemented {feature} which improved {metric} by {percentage}%",
-                "Refactored {component} resulting in {benefit}",
-                "Fixed {number} critical bugs in {project} ahead of deadline",
-                "Designed and implemented {architecture} to support {need}",
-                "Improved test coverage for {project} by {percentage}%"
-            ],
-            "UX Designer": [
-                "Completed user research for {project} revealing key insights about {area}",
-                "Redesigned {feature} which led to {percentage}% increase in user satisfaction",
-                "Created {deliverable} for {project} that was well-received by stakeholders",
-                "Conducted {number} usability tests identifying {benefit}",
-                "Implemented design system improvements for {benefit}"
-            ],
-            "Product Manager": [
-                "Led successful launch of {feature} resulting in {benefit}",
-                "Defined product requirements for {project} that aligned team efforts",
-                "Prioritized backlog effectively, increasing team velocity by {percentage}%",
-                "Gathered customer feedback that led to {benefit}",
-                "Facilitated cross-team coordination for {project}"
-            ],
-            "Data Scientist": [
-                "Developed {model} that improved prediction accuracy by {percentage}%",
-                "Analyzed {dataset} revealing insights about {area}",
-                "Implemented {technique} resulting in {benefit}",
-                "Optimized {process} reducing processing time by {percentage}%",
-                "Created dashboard for {metric} that improved decision-making"
-            ],
-            "DevOps Engineer": [
-                "Improved CI/CD pipeline reducing build time by {percentage}%",
-                "Implemented {tool} for {benefit}",
-                "Resolved {number} infrastructure issues improving system stability",
-                "Set up monitoring for {component} providing {benefit}",
-                "Reduced cloud costs by {percentage}% through {technique}"
-            ]
-        }
+        num_accomplishments = self._rng.randint(2, 4)
         
         # Get accomplishment templates for the role (use generic if role not found)
-        templates = role_accomplishments.get(role, [
-            "Completed {project} milestone ahead of schedule",
-            "Contributed significantly to {project} success",
-            "Demonstrated expertise in {area} that helped the team",
-            "Took initiative on {task} that led to {benefit}",
-            "Collaborated effectively with {team} to deliver {outcome}"
-        ])
-        
-        # Generate random accomplishments
+        templates = _ROLE_ACCOMPLISHMENTS.get(role, _GENERIC_ACCOMPLISHMENTS)
+        
+        # Generate random accomplishments, drawing only the fields each template uses
         for _ in range(num_accomplishments):
-            template = random.choice(templates)
-            accomplishment = template.format(
-                project=random.choice(projects) if projects else "the project",
-                feature=random.choice(["user authentication", "data visualization", "reporting module", "search functionality", "notification system"]),
-                component=random.choice(["backend services", "frontend components", "database layer", "API endpoints", "authentication system"]),
-                architecture=random.choice(["microservice architecture", "event-driven system", "caching layer", "data pipeline", "serverless functions"]),
-                need=random.choice(["scalability", "high availability", "real-time processing", "data integrity", "future growth"]), # Added "need"
-                area=random.choice(["user behavior", "performance bottlenecks", "customer preferences", "market trends", "system integration"]),
-                deliverable=random.choice(["wireframes", "prototypes", "user flow diagrams", "style guide", "interaction models"]),
-                model=random.choice(["prediction algorithm", "classification model", "recommendation system", "anomaly detection", "time series forecast"]),
-                dataset=random.choice(["customer behavior data", "system performance logs", "market research", "user feedback", "operational metrics"]),
-                technique=random.choice(["containerization", "infrastructure as code", "automated testing", "data preprocessing", "feature engineering"]),
-                process=random.choice(["ETL pipeline", "build process", "deployment workflow", "data ingestion", "reporting cycle"]),
-                tool=random.choice(["Kubernetes", "Terraform", "ELK stack", "Prometheus", "Jenkins"]),
-                task=random.choice(["performance optimization", "documentation", "cross-team coordination", "risk assessment", "customer outreach"]),
-                team=random.choice(["engineering", "product", "design", "marketing", "customer support"]),
-                outcome=random.choice(["successful release", "improved metrics", "positive customer feedback", "system stability", "new capability"]),
-                metric=random.choice(["performance", "user engagement", "conversion rate", "system uptime", "customer satisfaction"]),
-                benefit=random.choice(["improved maintainability", "faster performance", "better user experience", "reduced costs", "increased reliability"]),
-                percentage=random.randint(10, 50),
-                number=random.randint(3, 12)
-            )
-            accomplishments.append(accomplishment)
+            template = self._rng.choice(templates)
+            accomplishments.append(template.format_map(_AccomplishmentFields(projects, self._rng)))
         
         return accomplishments
     
     def _generate_positive_feedback(self, role, accomplishments):
         """Generate positive feedback based on role and accomplishments"""
         feedback_items = []
-        num_items = random.randint(2, 3)
-        
-        # General positive feedback templates
-        templates = [
-            "Your {quality} in {context} has been particularly impressive",
-            "I've noticed your exceptional {quality} while working on {context}",
-            "Your recent work demonstrates strong {quality}, especially in {context}",
-            "You've shown excellent {quality} that has {impact}",
-            "The team has benefited from your {quality} in {context}"
-        ]
-        
-        # Role-specific qualities
-        role_qualities = {
-            "Software Engineer": ["technical expertise", "problem-solving ability", "attention to code quality", "architectural thinking", "debugging skills"],
-            "UX Designer": ["design thinking", "user empathy", "visual communication", "attention to detail", "innovative solutions"],
-            "Product Manager": ["strategic thinking", "stakeholder management", "prioritization skills", "customer focus", "communication clarity"],
-            "Data Scientist": ["analytical rigor", "data interpretation", "statistical expertise", "insight generation", "technical communication"],
-            "DevOps Engineer": ["system reliability focus", "automation expertise", "proactive monitoring", "troubleshooting ability", "security mindset"]
-        }
+        num_items = self._rng.randint(2, 3)
         
         # Get qualities for the role (use generic if role not found)
-        qualities = role_qualities.get(role, ["teamwork", "initiative", "reliability", "adaptability", "communication"])
+        qualities = _ROLE_QUALITIES.get(role, _GENERIC_QUALITIES)
         
         # Generate positive feedback
         for _ in range(num_items):
-            template = random.choice(templates)
+            template = self._rng.choice(_POSITIVE_TEMPLATES)
             # Extract context from accomplishments if available
             context = "recent projects"
             if accomplishments:
-                accomplishment = random.choice(accomplishments)
+                accomplishment = self._rng.choice(accomplishments)
                 words = accomplishment.split()
                 if len(words) > 3:
                     context = " ".join(words[:3]) + "..."
             
             feedback = template.format(
-                quality=random.choice(qualities),
+                quality=self._rng.choice(qualities),
                 context=context,
-                impact=random.choice([
-                    "positively impacted the team's performance",
-                    "contributed to our success",
-                    "helped us meet our objectives",
-                    "improved our delivery process",
-                    "enhanced our product quality"
-                ])
+                impact=self._rng.choice(_IMPACTS)
             )
             feedback_items.append(feedback)
         
@@ -226,53 +431,14 @@ class TimelyFeedbackStep(StepBase):
     def _generate_constructive_feedback(self, role):
         """Generate constructive feedback based on role"""
         feedback_items = []
-        num_items = random.randint(1, 2)  # Fewer constructive feedback items than positive
-        
-        # Role-specific improvement areas
-        role_improvements = {
-            "Software Engineer": [
-                "Consider adding more comprehensive tests to ensure code reliability",
-                "Documentation could be more detailed for complex functions",
-                "Breaking down large pull requests into smaller ones would make reviews easier",
-                "More proactive communication about technical challenges would help with planning"
-            ],
-            "UX Designer": [
-                "Including more context in design presentations would help stakeholders understand decisions",
-                "Earlier sharing of design concepts could help catch issues sooner",
-                "More detailed documentation of user research findings would benefit the team",
-                "Consider more diverse user personas in testing scenarios"
-            ],
-            "Product Manager": [
-                "More detailed acceptance criteria would help development teams",
-                "Earlier communication about scope changes would improve planning",
-                "More frequent check-ins with development teams could prevent misalignment",
-                "Consider gathering more quantitative data to support feature decisions"
-            ],
-            "Data Scientist": [
-                "More documentation of methodologies would help others understand your approach",
-                "Consider simpler models for initial solutions before optimizing",
-                "More context in presentations would help non-technical stakeholders",
-                "Earlier sharing of preliminary findings could guide project direction"
-            ],
-            "DevOps Engineer": [
-                "More documentation for system configurations would help team knowledge",
-                "Consider more proactive communication about infrastructure changes",
-                "Involving developers earlier in deployment planning could improve outcomes",
-                "More comprehensive monitoring alerts would help catch issues sooner"
-            ]
-        }
+        num_items = self._rng.randint(1, 2)  # Fewer constructive feedback items than positive
         
         # Get improvement areas for the role (use generic if role not found)
-        improvements = role_improvements.get(role, [
-            "More proactive communication would help with team coordination",
-            "Consider documenting your process to help knowledge sharing",
-            "Earlier flagging of potential issues would help with risk management",
-            "More detailed updates in team meetings would improve visibility"
-        ])
+        improvements = _ROLE_IMPROVEMENTS.get(role, _GENERIC_IMPROVEMENTS)
         
         # Generate constructive feedback
         for _ in range(num_items):
-            feedback_items.append(random.choice(improvements))
+            feedback_items.append(self._rng.choice(improvements))
         
         return feedback_items
     
@@ -281,79 +447,51 @@ class TimelyFeedbackStep(StepBase):
         action_items = []
         
         for feedback in constructive_feedback:
-            # Extract key theme from feedback
-            words = feedback.lower().split()
-            if "documentation" in feedback.lower():
-                action = "Create a documentation template for future work"
-            elif "communication" in feedback.lower():
-                action = "Schedule regular check-ins with team members"
-            elif "test" in feedback.lower():
-                action = "Implement test-driven development approach"
-            elif "review" in feedback.lower() or "pull request" in feedback.lower():
-                action = "Break down large changes into smaller, focused pull requests"
-            elif "design" in feedback.lower():
-                action = "Share design concepts earlier in the process"
-            elif "data" in feedback.lower():
-                action = "Create a data collection and analysis plan"
-            elif "monitoring" in feedback.lower() or "alert" in feedback.lower():
-                action = "Review and enhance monitoring system"
+            # Extract key theme from feedback; when several themes appear, the
+            # highest-priority one wins
+            for theme_re, action in _ACTION_THEMES:
+                if theme_re.search(feedback):
+                    break
             else:
-                action = "Create a personal improvement plan focused on " + words[1] if len(words) > 1 else "key areas"
+                words = feedback.lower().split()
+                action = f"Create a personal improvement plan focused on {words[1] if len(words) > 1 else 'key areas'}"
             
             action_items.append(action)
         
         # Add one generic action item if we have few items
         if len(action_items) < 2:
-            generic_actions = [
-                "Schedule a follow-up discussion to review progress",
-                "Document learnings and share with the team",
-                "Identify a mentor who excels in this area",
-                "Research best practices and create a personal guide"
-            ]
-            action_items.append(random.choice(generic_actions))
+            action_items.append(self._rng.choice(_GENERIC_ACTIONS))
         
         return action_items
     
     def _generate_feedback_markdown(self, feedback):
         """Generate a markdown report of the feedback for a team member"""
-        member_name = feedback["member"]["name"]
-        role = feedback["member"]["role"]
-        date = feedback["date"]
-        follow_up_date = feedback["follow_up_date"]
-        
-        markdown = f"# Timely Feedback for {member_name}\n\n"
-        markdown += f"**Role:** {role}\n\n"
-        markdown += f"**Date:** {date}\n\n"
-        markdown += f"**Follow-up Date:** {follow_up_date}\n\n"
-        
-        markdown += "## Recent Accomplishments\n\n"
-        for accomplishment in feedback["recent_accomplishments"]:
-            markdown += f"- {accomplishment}\n"
-        markdown += "\n"
-        
-        markdown += "## Positive Feedback\n\n"
-        for item in feedback["positive_feedback"]:
-            markdown += f"- {item}\n"
-        markdown += "\n"
-        
-        markdown += "## Areas for Growth\n\n"
-        for item in feedback["constructive_feedback"]:
-            markdown += f"- {item}\n"
-        markdown += "\n"
-        
-        markdown += "## Action Items\n\n"
-        for item in feedback["action_items"]:
-            markdown += f"- {item}\n"
-        markdown += "\n"
-        
-        return markdown
+        parts = [_FEEDBACK_HEADER.format(
+            name=feedback["member"]["name"],
+            role=feedback["member"]["role"],
+            date=feedback["date"],
+            follow_up_date=feedback["follow_up_date"]
+        )]
+        parts.extend(f"- {accomplishment}\n" for accomplishment in feedback["recent_accomplishments"])
+        
+        parts.append("\n## Positive Feedback\n\n")
+        parts.extend(f"- {item}\n" for item in feedback["positive_feedback"])
+        
+        parts.append("\n## Areas for Growth\n\n")
+        parts.extend(f"- {item}\n" for item in feedback["constructive_feedback"])
+        
+        parts.append("\n## Action Items\n\n")
+        parts.extend(f"- {item}\n" for item in feedback["action_items"])
+        parts.append("\n")
+        
+        return "".join(parts)
     
     def _generate_summary_markdown(self, feedback_data):
         """Generate a summary markdown report of all feedback"""
-        markdown = "# Timely Feedback Summary\n\n"
+        parts = ["# Timely Feedback Summary\n\n"]
         
-        markdown += f"**Date:** {datetime.now().strftime('%Y-%m-%d')}\n\n"
-        markdown += f"**Number of Team Members:** {len(feedback_data)}\n\n"
+        parts.append(f"**Date:** {datetime.now().strftime('%Y-%m-%d')}\n\n")
+        parts.append(f"**Number of Team Members:** {len(feedback_data)}\n\n")
         
         # Calculate total number of accomplishments and feedback items
         total_accomplishments = sum(len(f["recent_accomplishments"]) for f in feedback_data)
@@ -361,24 +499,25 @@ class TimelyFeedbackStep(StepBase):
         total_constructive = sum(len(f["constructive_feedback"]) for f in feedback_data)
         total_actions = sum(len(f["action_items"]) for f in feedback_data)
         
-        markdown += "## Feedback Overview\n\n"
-        markdown += f"- **Total Accomplishments Recognized:** {total_accomplishments}\n"
-        markdown += f"- **Total Positive Feedback Items:** {total_positive}\n"
-        markdown += f"- **Total Areas for Growth Identified:** {total_constructive}\n"
-        markdown += f"- **Total Action Items Created:** {total_actions}\n\n"
+        parts.append("## Feedback Overview\n\n")
+        parts.append(f"- **Total Accomplishments Recognized:** {total_accomplishments}\n")
+        parts.append(f"- **Total Positive Feedback Items:** {total_positive}\n")
+        parts.append(f"- **Total Areas for Growth Identified:** {total_constructive}\n")
+        parts.append(f"- **Total Action Items Created:** {total_actions}\n\n")
         
         # Team member summaries
-        markdown += "## Team Member Summaries\n\n"
-        for feedback in feedback_data:
-            member_name = feedback["member"]["name"]
-            role = feedback["member"]["role"]
-            follow_up = feedback["follow_up_date"]
-            
-            markdown += f"### {member_name} ({role})\n\n"
-            markdown += f"- **Accomplishments:** {len(feedback['recent_accomplishments'])}\n"
-            markdown += f"- **Positive Feedback Items:** {len(feedback['positive_feedback'])}\n"
-            markdown += f"- **Areas for Growth:** {len(feedback['constructive_feedback'])}\n"
-            markdown += f"- **Action Items:** {len(feedback['action_items'])}\n"
-            markdown += f"- **Follow-up Date:** {follow_up}\n\n"
-        
-        return markdown
+        parts.append("## Team Member Summaries\n\n")
+        parts.extend(
+            _SUMMARY_MEMBER_BLOCK.format(
+                name=feedback["member"]["name"],
+                role=feedback["member"]["role"],
+                accomplishments=len(feedback["recent_accomplishments"]),
+                positive=len(feedback["positive_feedback"]),
+                constructive=len(feedback["constructive_feedback"]),
+                actions=len(feedback["action_items"]),
+                follow_up_date=feedback["follow_up_date"]
+            )
+            for feedback in feedback_data
+        )
+        
+        return "".join(parts)
@@ -34,8 +34,7 @@ class UpdateContributionGoalStep(StepBase):
             return False
         
         # Load contribution goals
-        with open(contribution_goals_path, "r", encoding="utf-8") as f:
-            original_goals = json.load(f)
+        original_goals = self.read_json_cached(contribution_goals_path)
         
         # Generate progress data for each goal
         updated_goals = self._update_contribution_goals(original_goals)
@@ -45,7 +44,7 @@ class UpdateContributionGoalStep(StepBase):
         
         # Also write a markdown summary for each team member
         for member_goals in updated_goals:
-            member_name = member_goals["member_name"].replace(" ", "_").lower()
+            member_name = self.member_slug(member_goals["member_name"])
             self.write_output_file(
                 f"{member_name}_updated_goals.md",
                 self._generate_updated_goals_markdown(member_goals)
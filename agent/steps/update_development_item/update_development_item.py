@@ -35,8 +35,7 @@ class UpdateDevelopmentItemStep(StepBase):
         
         # Load development items
         try:
-            with open(development_items_path, "r", encoding="utf-8") as f:
-                original_items = json.load(f)
+            original_items = self.read_json_cached(development_items_path)
         except FileNotFoundError:
             logger.error(f"Development items file not found at {development_items_path}")
             return False
@@ -55,7 +54,7 @@ class UpdateDevelopmentItemStep(StepBase):
         
         # Also write a markdown summary for each team member
         for member_items in updated_items:
-            member_name = member_items["member_name"].replace(" ", "_").lower()
+            member_name = self.member_slug(member_items["member_name"])
             self.write_output_file(
                 f"{member_name}_updated_development.md",
                 self._generate_updated_development_markdown(member_items)
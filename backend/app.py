@@ -373,14 +373,10 @@ def api_approve_step(step_id):
 def api_run_step(step_id):
     """Run a specific step"""
     try:
-        # Ensure the parent directory of 'agent' is in sys.path
-        # to allow imports like 'from agent.agent_base import AgentBase'
-        import sys
-        # AGENT_DIR is defined as os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'agent'))
-        # We need its parent in sys.path for 'import agent.agent_base'
-        # or AGENT_DIR itself if we are doing 'from agent_base import AgentBase'
-        # Let's add the parent of AGENT_DIR to sys.path to be safe for package imports.
-        agent_parent_dir = os.path.abspath(os.path.join(AGENT_DIR, '..'))
+        # Ensure the parent directory of 'agent' is in sys.path to allow imports like
+        # 'from agent.agent_base import AgentBase'. AGENT_DIR is already absolute, so
+        # its parent is a plain dirname; once set up, this is a single membership test
+        agent_parent_dir = os.path.dirname(AGENT_DIR)
         if agent_parent_dir not in sys.path:
             sys.path.insert(0, agent_parent_dir) # Insert at the beginning for priority
 
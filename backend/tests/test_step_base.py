@@ -0,0 +1,282 @@
+"""
+Unit tests for the output caches and write helpers in agent/step_base.py.
+
+This module tests the StepBase output cache, the parsed-JSON cache, the
+concurrent output writer and the writev loop, plus the output caches of the
+evaluation_generation and timely_feedback steps, using a temporary directory
+to avoid affecting real data.
+
+Usage:
+    python -m unittest tests/test_step_base.py
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+# The repository root, from which the agent package is importable
+repo_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _unload_agent():
+    """Drop the agent package and its submodules from the module cache."""
+    for name in [name for name in sys.modules if name == "agent" or name.startswith("agent.")]:
+        del sys.modules[name]
+
+
+def setUpModule():
+    """Import the agent package for the tests in this module.
+
+    The API tests expect the agent package not to be importable, so the
+    repository root is only added to the system path while these tests run.
+    """
+    global step_base, StepBase, DataAnalysisStep, EvaluationGenerationStep, TimelyFeedbackStep
+    # Other tests may have imported an agent package from a temporary directory
+    _unload_agent()
+    sys.path.insert(0, repo_dir)
+
+    from agent import step_base
+    from agent.step_base import StepBase
+    from agent.steps.data_analysis import DataAnalysisStep
+    from agent.steps.evaluation_generation import EvaluationGenerationStep
+    from agent.steps.timely_feedback import TimelyFeedbackStep
+
+
+def tearDownModule():
+    """Remove the repository root from the system path and unload the agent package."""
+    sys.path.remove(repo_dir)
+    _unload_agent()
+
+
+class StepBaseTestCase(unittest.TestCase):
+    """Test case for the StepBase caches and write helpers."""
+
+    def setUp(self):
+        """Set up a step writing to a temporary output directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.step = StepBase(
+            "test_step",
+            os.path.join(self.test_dir, "in"),
+            os.path.join(self.test_dir, "out"),
+        )
+        os.makedirs(self.step.output_dir)
+
+    def tearDown(self):
+        """Clean up after each test."""
+        shutil.rmtree(self.test_dir)
+
+    def read_output(self, filename):
+        """Return the contents of an output file."""
+        with open(self.step.get_output_path(filename), "r", encoding="utf-8") as f:
+            return f.read()
+
+    def test_restore_cached_outputs_miss(self):
+        """Test that restoring an unknown cache key reports a miss."""
+        self.assertFalse(self.step.restore_cached_outputs("missing"))
+
+    def test_restore_cached_outputs_hit(self):
+        """Test that saved outputs are restored under their cache key."""
+        self.step.write_output_file("report.md", "# Report\n")
+        self.step.save_cached_outputs("key1", ["report.md"])
+        os.remove(self.step.get_output_path("report.md"))
+
+        self.assertTrue(self.step.restore_cached_outputs("key1"))
+        self.assertEqual(self.read_output("report.md"), "# Report\n")
+
+    def test_save_cached_outputs_keeps_latest_entry(self):
+        """Test that saving a new cache entry invalidates the previous one."""
+        self.step.write_output_file("report.md", "first")
+        self.step.save_cached_outputs("key1", ["report.md"])
+        self.step.write_output_file("report.md", "second")
+        self.step.save_cached_outputs("key2", ["report.md"])
+
+        self.assertFalse(self.step.restore_cached_outputs("key1"))
+        self.assertTrue(self.step.restore_cached_outputs("key2"))
+        self.assertEqual(self.read_output("report.md"), "second")
+
+    def test_read_json_cached_reuses_parse(self):
+        """Test that an unchanged file is parsed only once."""
+        path = self.step.get_output_path("data.json")
+        self.step.write_output_file("data.json", '{"value": 1}')
+
+        with mock.patch.object(step_base, "_load_json_file", wraps=step_base._load_json_file) as load:
+            first = self.step.read_json_cached(path)
+            second = self.step.read_json_cached(path)
+
+        self.assertEqual(first, {"value": 1})
+        self.assertIs(first, second)
+        self.assertEqual(load.call_count, 1)
+
+    def test_read_json_cached_stale_on_mtime_change(self):
+        """Test that a file rewritten with the same size is parsed again."""
+        path = self.step.get_output_path("data.json")
+        self.step.write_output_file("data.json", '{"value": 1}')
+        self.assertEqual(self.step.read_json_cached(path), {"value": 1})
+
+        # Same size, so only the modification time tells the versions apart
+        self.step.write_output_file("data.json", '{"value": 2}')
+        mtime_ns = os.stat(path).st_mtime_ns + 1_000_000_000
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        self.assertEqual(self.step.read_json_cached(path), {"value": 2})
+
+    @unittest.skipUnless(hasattr(os, "writev"), "os.writev is not available")
+    def test_write_all_resumes_partial_writev(self):
+        """Test that buffers are written in full when writev writes only part of them."""
+        real_writev = os.writev
+
+        def short_writev(fd, buffers):
+            # Write at most 3 bytes per call, splitting buffers mid-way
+            return real_writev(fd, [bytes(b"".join(buffers)[:3])])
+
+        path = self.step.get_output_path("parts.txt")
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            with mock.patch.object(step_base.os, "writev", side_effect=short_writev) as writev:
+                step_base._write_all(fd, [b"hello", b"", b" ", b"world"])
+        finally:
+            os.close(fd)
+
+        self.assertEqual(self.read_output("parts.txt"), "hello world")
+        self.assertEqual(writev.call_count, 4)
+
+    def test_write_outputs_concurrently(self):
+        """Test that every job writes its file."""
+        jobs = [
+            (f"member_{i}.md", lambda filename, i=i: self.step.write_output_file(filename, str(i)))
+            for i in range(20)
+        ]
+
+        self.assertTrue(self.step.write_outputs_concurrently(jobs))
+        for i in range(20):
+            self.assertEqual(self.read_output(f"member_{i}.md"), str(i))
+
+    def test_write_outputs_concurrently_same_filename(self):
+        """Test that jobs sharing a filename run in order, so the last one wins."""
+        jobs = [
+            ("jane_doe.md", lambda filename, i=i: self.step.write_output_file(filename, str(i)))
+            for i in range(5)
+        ]
+
+        self.assertTrue(self.step.write_outputs_concurrently(jobs))
+        self.assertEqual(self.read_output("jane_doe.md"), "4")
+
+    def test_write_outputs_concurrently_os_error(self):
+        """Test that an OS error in one job fails the call without stopping the others."""
+        def fail(filename):
+            raise OSError("disk full")
+
+        jobs = [
+            ("broken.md", fail),
+            ("report.md", lambda filename: self.step.write_output_file(filename, "ok")),
+        ]
+
+        self.assertFalse(self.step.write_outputs_concurrently(jobs))
+        self.assertEqual(self.read_output("report.md"), "ok")
+
+
+class StepOutputCacheTestCase(unittest.TestCase):
+    """Test case for the output caches of the pipeline steps."""
+
+    def setUp(self):
+        """Run the data_analysis step into a temporary steps directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.analysis_out = self.make_dirs("data_analysis")[1]
+        DataAnalysisStep("data_analysis", *self.make_dirs("data_analysis")).execute()
+
+    def tearDown(self):
+        """Clean up after each test."""
+        shutil.rmtree(self.test_dir)
+
+    def make_dirs(self, step_id):
+        """Create and return the input and output directories of a step."""
+        input_dir = os.path.join(self.test_dir, step_id, "in")
+        output_dir = os.path.join(self.test_dir, step_id, "out")
+        os.makedirs(input_dir, exist_ok=True)
+        os.makedirs(output_dir, exist_ok=True)
+        return input_dir, output_dir
+
+    def make_step(self, step_class, step_id):
+        """Create a step reading from the temporary steps directory."""
+        return step_class(step_id, *self.make_dirs(step_id))
+
+    def change_team_data(self):
+        """Rename the first team member in the data_analysis output."""
+        path = os.path.join(self.analysis_out, "team_data.json")
+        with open(path, "r", encoding="utf-8") as f:
+            team_data = json.load(f)
+        team_data[0]["member"]["name"] = "Renamed Member"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(team_data, f)
+
+    def test_evaluation_generation_cache_hit(self):
+        """Test that unchanged inputs restore the evaluations without regenerating them."""
+        step = self.make_step(EvaluationGenerationStep, "evaluation_generation")
+        self.assertTrue(step.execute())
+        evaluations_path = step.get_output_path("evaluations.json")
+        with open(evaluations_path, "rb") as f:
+            expected = f.read()
+        os.remove(evaluations_path)
+
+        with mock.patch.object(EvaluationGenerationStep, "_generate_evaluations") as generate:
+            self.assertTrue(step.execute())
+
+        generate.assert_not_called()
+        with open(evaluations_path, "rb") as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_evaluation_generation_cache_miss_on_input_change(self):
+        """Test that changed inputs regenerate the evaluations."""
+        step = self.make_step(EvaluationGenerationStep, "evaluation_generation")
+        self.assertTrue(step.execute())
+        self.change_team_data()
+
+        with mock.patch.object(
+            EvaluationGenerationStep, "_generate_evaluations", wraps=step._generate_evaluations
+        ) as generate:
+            self.assertTrue(step.execute())
+
+        generate.assert_called_once()
+
+    def test_timely_feedback_cache_hit(self):
+        """Test that unchanged team data restores the same feedback."""
+        step = self.make_step(TimelyFeedbackStep, "timely_feedback")
+        self.assertTrue(step.execute())
+        feedback_path = step.get_output_path("timely_feedback.json")
+        with open(feedback_path, "rb") as f:
+            expected = f.read()
+        os.remove(feedback_path)
+
+        with mock.patch.object(TimelyFeedbackStep, "_generate_timely_feedback") as generate:
+            self.assertTrue(step.execute())
+
+        generate.assert_not_called()
+        with open(feedback_path, "rb") as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_timely_feedback_cache_key_changes_with_inputs_and_date(self):
+        """Test that the timely feedback cache key covers the team data and the run date."""
+        step = self.make_step(TimelyFeedbackStep, "timely_feedback")
+        team_data_path = os.path.join(self.analysis_out, "team_data.json")
+        module = "agent.steps.timely_feedback.timely_feedback.datetime"
+
+        with mock.patch(module) as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 1, 6)
+            key = step._cache_key(team_data_path)
+            self.assertEqual(step._cache_key(team_data_path), key)
+
+            mock_datetime.now.return_value = datetime(2025, 1, 7)
+            self.assertNotEqual(step._cache_key(team_data_path), key)
+
+            mock_datetime.now.return_value = datetime(2025, 1, 6)
+            self.change_team_data()
+            self.assertNotEqual(step._cache_key(team_data_path), key)
+
+
+if __name__ == "__main__":
+    unittest.main()
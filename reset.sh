@@ -64,6 +64,8 @@ for step in "${STEP_DIRS[@]}"; do
         echo -e "Cleaning $step output directory..."
         # Remove all files but keep the directory
         rm -f "$STEP_OUT_DIR"/*
+        # The glob skips dot-directories, so drop the cached outputs explicitly
+        rm -rf "$STEP_OUT_DIR/.cache"
         
         # Also ensure the input directory exists
         mkdir -p "$STEPS_DIR/$step/in"